@@ -12,12 +12,21 @@ from pathlib import Path
 import argparse
 from datetime import datetime, timedelta
 
+from workload_data import read_workload_over_time
+
 def load_dataset(data_path):
     """Load M-DRA dataset files"""
+    data_dir = Path(data_path)
     try:
-        jobs_df = pd.read_csv(Path(data_path) / 'jobs.csv')
-        nodes_df = pd.read_csv(Path(data_path) / 'nodes.csv')
-        clusters_df = pd.read_csv(Path(data_path) / 'clusters_cap.csv')
+        jobs_df = pd.read_csv(data_dir / 'jobs.csv')
+        nodes_df = pd.read_csv(data_dir / 'nodes.csv')
+        clusters_df = pd.read_csv(data_dir / 'clusters_cap.csv')
+        
+        # Cluster ids have only a handful of values; categorical codes keep
+        # the column small and make the per-cluster groupbys cheap
+        cluster_ids = sorted(clusters_df['id'].unique())
+        jobs_df['default_cluster'] = pd.Categorical(jobs_df['default_cluster'], categories=cluster_ids)
+        nodes_df['default_cluster'] = pd.Categorical(nodes_df['default_cluster'], categories=cluster_ids)
         
         print(f"✅ Loaded {len(jobs_df)} jobs, {len(nodes_df)} nodes, {len(clusters_df)} clusters")
         return jobs_df, nodes_df, clusters_df
@@ -31,38 +40,47 @@ def analyze_workload_distribution(jobs_df, nodes_df, clusters_df):
     # Cluster mapping
     cluster_names = {0: 'k8s-cicd', 1: 'k8s-mano', 2: 'pat-141', 3: 'pat-171'}
     
-    # Calculate cluster capacities
+    # Calculate cluster capacities with one grouped pass over the nodes
+    node_sums = nodes_df.groupby('default_cluster', observed=True).agg(
+        cpu=('cpu_cap', 'sum'), memory=('mem_cap', 'sum'),
+        vf=('vf_cap', 'sum'), nodes=('cpu_cap', 'size'))
+    node_sums.index = node_sums.index.astype(int)
+    node_sums = node_sums.reindex(clusters_df['id'].to_numpy(), fill_value=0)
+    
     cluster_capacities = {}
-    for _, cluster in clusters_df.iterrows():
-        cluster_id = cluster['id']
-        cluster_name = cluster_names[cluster_id]
-        
-        # Get nodes in this cluster
-        cluster_nodes = nodes_df[nodes_df['default_cluster'] == cluster_id]
-        total_cpu = cluster_nodes['cpu_cap'].sum()
-        total_memory = cluster_nodes['mem_cap'].sum()
-        total_vf = cluster_nodes['vf_cap'].sum()
-        
-        cluster_capacities[cluster_name] = {
-            'cpu': total_cpu,
-            'memory': total_memory,
-            'vf': total_vf,
-            'nodes': len(cluster_nodes)
+    for cluster_id, cpu, memory, vf, nodes in zip(
+            node_sums.index, *(node_sums[col].to_numpy() for col in ['cpu', 'memory', 'vf', 'nodes'])):
+        cluster_capacities[cluster_names[cluster_id]] = {
+            'cpu': cpu,
+            'memory': memory,
+            'vf': vf,
+            'nodes': int(nodes)
         }
     
-    # Calculate job distribution
+    # Calculate job distribution with one grouped pass over the jobs
+    job_sums = jobs_df.groupby('default_cluster', observed=True).agg(
+        job_count=('duration', 'size'), avg_duration=('duration', 'mean'),
+        total_cpu=('cpu_req', 'sum'), total_memory=('mem_req', 'sum'),
+        total_vf=('vf_req', 'sum'))
+    job_sums.index = job_sums.index.astype(int)
+    job_sums = job_sums.reindex(list(cluster_names))
+    job_sums[['job_count', 'total_cpu', 'total_memory', 'total_vf']] = (
+        job_sums[['job_count', 'total_cpu', 'total_memory', 'total_vf']].fillna(0))
+    
     job_distribution = {}
     resource_usage = {}
     
-    for cluster_id, cluster_name in cluster_names.items():
-        cluster_jobs = jobs_df[jobs_df['default_cluster'] == cluster_id]
+    job_columns = ['job_count', 'avg_duration', 'total_cpu', 'total_memory', 'total_vf']
+    for cluster_id, count, avg_duration, total_cpu, total_memory, total_vf in zip(
+            job_sums.index, *(job_sums[col].to_numpy() for col in job_columns)):
+        cluster_name = cluster_names[cluster_id]
         
         job_distribution[cluster_name] = {
-            'count': len(cluster_jobs),
-            'avg_duration': cluster_jobs['duration'].mean(),
-            'total_cpu': cluster_jobs['cpu_req'].sum(),
-            'total_memory': cluster_jobs['mem_req'].sum(),
-            'total_vf': cluster_jobs['vf_req'].sum()
+            'count': int(count),
+            'avg_duration': avg_duration,
+            'total_cpu': total_cpu,
+            'total_memory': total_memory,
+            'total_vf': total_vf
         }
         
         # Calculate utilization percentage
@@ -76,8 +94,15 @@ def analyze_workload_distribution(jobs_df, nodes_df, clusters_df):
     
     return cluster_capacities, job_distribution, resource_usage
 
-def create_overview_visualization(jobs_df, nodes_df, clusters_df, output_path):
-    """Create comprehensive dataset overview visualization"""
+def create_overview_visualization(jobs_df, nodes_df, clusters_df, output_path, analysis=None):
+    """Create comprehensive dataset overview visualization
+    
+    analysis: optional result of analyze_workload_distribution() for the same
+    frames, so callers that already computed it don't pay for it twice
+    """
+    
+    output_dir = Path(output_path)
+    dataset_name = output_dir.name
     
     # Set up the figure with subplots - adjusted spacing to minimize whitespace
     fig = plt.figure(figsize=(24, 14))
@@ -89,7 +114,15 @@ def create_overview_visualization(jobs_df, nodes_df, clusters_df, output_path):
     cluster_names = ['k8s-cicd', 'k8s-mano', 'pat-141', 'pat-171']
     
     # Get analysis data
-    cluster_capacities, job_distribution, resource_usage = analyze_workload_distribution(jobs_df, nodes_df, clusters_df)
+    if analysis is None:
+        analysis = analyze_workload_distribution(jobs_df, nodes_df, clusters_df)
+    cluster_capacities, job_distribution, resource_usage = analysis
+    
+    # Column statistics reused by several panels
+    dur_arr = jobs_df['duration'].to_numpy()
+    avg_duration = float(dur_arr.mean())
+    sriov_mask = jobs_df['vf_req'].to_numpy() > 0
+    sriov_jobs = int(sriov_mask.sum())
     
     # 1. Dataset Summary (Top Left)
     ax1 = fig.add_subplot(gs[0, 0])
@@ -98,7 +131,6 @@ def create_overview_visualization(jobs_df, nodes_df, clusters_df, output_path):
     total_jobs = len(jobs_df)
     total_nodes = len(nodes_df)
     total_clusters = len(clusters_df)
-    avg_duration = jobs_df['duration'].mean()
     
     summary_text = f"""M-DRA Dataset Overview
     
@@ -200,45 +232,43 @@ Targets:
     # 5. Job Duration Distribution (Middle Left)
     ax5 = fig.add_subplot(gs[1, 0])
     
-    ax5.hist(jobs_df['duration'], bins=30, alpha=0.7, color='steelblue', edgecolor='black')
+    counts, edges = np.histogram(dur_arr, bins=30)
+    ax5.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+            alpha=0.7, color='steelblue', edgecolor='black')
     ax5.set_xlabel('Duration (minutes)')
     ax5.set_ylabel('Number of Jobs')
     ax5.set_title('Job Duration Distribution')
-    ax5.axvline(jobs_df['duration'].mean(), color='red', linestyle='--', 
-               label=f'Avg: {jobs_df["duration"].mean():.1f}min')
+    ax5.axvline(avg_duration, color='red', linestyle='--', 
+               label=f'Avg: {avg_duration:.1f}min')
     ax5.legend()
     
     # 6. Resource Request Distribution (Middle Center-Left)
     ax6 = fig.add_subplot(gs[1, 1])
     
-    # CPU vs Memory scatter plot
-    scatter = ax6.scatter(jobs_df['cpu_req'], jobs_df['mem_req']/1000, 
-                         c=jobs_df['default_cluster'], cmap='tab10', alpha=0.6, s=30)
+    # CPU vs Memory scatter plot, one constant-colour series per cluster
+    jobs_by_cluster = dict(tuple(jobs_df.groupby('default_cluster', observed=True)))
+    for cluster_id, cluster_name in enumerate(cluster_names):
+        cluster_jobs = jobs_by_cluster.get(cluster_id)
+        if cluster_jobs is None:
+            continue
+        ax6.scatter(cluster_jobs['cpu_req'].to_numpy(), cluster_jobs['mem_req'].to_numpy() / 1000,
+                    color=colors[cluster_id], label=cluster_name, alpha=0.6, s=30, rasterized=True)
     ax6.set_xlabel('CPU Request (cores)')
     ax6.set_ylabel('Memory Request (GB)')
     ax6.set_title('Job Resource Requests')
-    
-    # Add cluster legend
-    legend_elements = [plt.scatter([], [], c=colors[i], s=50, label=cluster_names[i]) 
-                      for i in range(len(cluster_names))]
-    ax6.legend(handles=legend_elements, loc='upper right')
+    ax6.legend(loc='upper right')
     
     # 7. Node Capacity Distribution (Middle Center-Right)
     ax7 = fig.add_subplot(gs[1, 2])
     
-    # Stacked bar for node capacities by cluster
-    cluster_node_cpu = []
-    cluster_node_memory = []
-    
-    for cluster_id in range(len(cluster_names)):
-        cluster_nodes = nodes_df[nodes_df['default_cluster'] == cluster_id]
-        cluster_node_cpu.append(cluster_nodes['cpu_cap'].tolist())
-        cluster_node_memory.append(cluster_nodes['mem_cap'].tolist())
-    
+    # Group nodes once so each cluster's capacities are a plain NumPy array
+    nodes_by_cluster = dict(tuple(nodes_df.groupby('default_cluster', observed=True)))
+    empty_caps = np.empty(0)
+
     # Box plot for CPU capacities
-    ax7.boxplot([nodes_df[nodes_df['default_cluster'] == i]['cpu_cap'].tolist() 
-                for i in range(len(cluster_names))], 
-               tick_labels=cluster_names)
+    cpu_cap_data = [nodes_by_cluster[i]['cpu_cap'].to_numpy() if i in nodes_by_cluster else empty_caps
+                    for i in range(len(cluster_names))]
+    ax7.boxplot(cpu_cap_data, tick_labels=cluster_names)
     ax7.set_ylabel('CPU Capacity (cores)')
     ax7.set_title('Node CPU Capacity Distribution')
     ax7.tick_params(axis='x', rotation=45)
@@ -267,11 +297,7 @@ Targets:
     ax9.axis('off')
     
     # Calculate some key metrics
-    total_cpu = sum(cluster_capacities[c]['cpu'] for c in clusters)
-    total_memory = sum(cluster_capacities[c]['memory'] for c in clusters)
-    total_vf = sum(cluster_capacities[c]['vf'] for c in clusters)
-    
-    sriov_jobs = len(jobs_df[jobs_df['vf_req'] > 0])
+    total_cpu, total_memory, total_vf = nodes_df[['cpu_cap', 'mem_cap', 'vf_cap']].sum().to_numpy()
     
     specs_text = f"""System Specifications
     
@@ -297,10 +323,11 @@ Performance:
     # 10. Peak Load Analysis (Bottom Center)
     ax10 = fig.add_subplot(gs[2, 1:3])
     
-    # Load workload timeline data if available
-    workload_file = Path(output_path) / f"{Path(output_path).name}_workload_over_time.csv"
-    if workload_file.exists():
-        workload_df = pd.read_csv(workload_file)
+    # Load workload timeline data if available (Parquet or CSV, whichever was written last)
+    workload_df = read_workload_over_time(
+        output_dir, dataset_name, ['timeslice', 'cluster_id', 'cpu_utilization', 'mem_utilization'])
+    if workload_df is not None:
+        workload_df['cluster_id'] = workload_df['cluster_id'].astype('category')
         
         # Filter for k8s-cicd cluster (cluster_id = 0)
         cicd_data = workload_df[workload_df['cluster_id'] == 0]
@@ -372,10 +399,12 @@ Optimization:
     fig.text(0.99, 0.01, f'Generated: {timestamp}', ha='right', va='bottom', 
              fontsize=8, alpha=0.6)
     
-    # Save the overview with minimal padding to reduce whitespace
-    output_file = Path(output_path) / f"{Path(output_path).name}_dataset_overview.png"
-    plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white', 
-                pad_inches=0.2)
+    # Save the overview cropped to everything drawn, with minimal padding -
+    # measured from one draw instead of bbox_inches='tight'
+    fig.canvas.draw()
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.2)
+    output_file = output_dir / f"{dataset_name}_dataset_overview.png"
+    plt.savefig(output_file, dpi=300, bbox_inches=bbox, facecolor='white')
     print(f"📊 Dataset overview saved: {output_file}")
     return fig
 
@@ -392,8 +421,11 @@ def main():
     if jobs_df is None:
         return
     
+    # Analyze once and hand the result to the visualization
+    analysis = analyze_workload_distribution(jobs_df, nodes_df, clusters_df)
+    
     # Create overview visualization
-    fig = create_overview_visualization(jobs_df, nodes_df, clusters_df, args.data_path)
+    fig = create_overview_visualization(jobs_df, nodes_df, clusters_df, args.data_path, analysis=analysis)
     
     print("🎉 Overview generation completed!")
 
@@ -12,14 +12,28 @@ from pathlib import Path
 import argparse
 from datetime import datetime
 
+from workload_data import read_workload_over_time
+
 def create_slide_summary(data_path):
     """Create a clean summary visualization for presentations"""
     
+    data_dir = Path(data_path)
+    dataset_name = data_dir.name
+    
     # Load data
-    jobs_df = pd.read_csv(Path(data_path) / 'jobs.csv')
-    nodes_df = pd.read_csv(Path(data_path) / 'nodes.csv')
-    clusters_df = pd.read_csv(Path(data_path) / 'clusters_cap.csv')
-    workload_df = pd.read_csv(Path(data_path) / f"{Path(data_path).name}_workload_over_time.csv")
+    jobs_df = pd.read_csv(data_dir / 'jobs.csv')
+    nodes_df = pd.read_csv(data_dir / 'nodes.csv')
+    clusters_df = pd.read_csv(data_dir / 'clusters_cap.csv')
+    workload_df = read_workload_over_time(
+        data_dir, dataset_name, ['timeslice', 'cluster_id', 'cpu_utilization', 'mem_utilization'])
+    if workload_df is None:
+        raise FileNotFoundError(f"No {dataset_name}_workload_over_time.parquet or .csv in {data_dir} - "
+                                f"run visualize_workload_over_time.py first")
+    
+    # Few distinct cluster ids - categorical codes make the per-cluster filters cheap
+    cluster_ids = sorted(clusters_df['id'].unique())
+    jobs_df['default_cluster'] = pd.Categorical(jobs_df['default_cluster'], categories=cluster_ids)
+    workload_df['cluster_id'] = pd.Categorical(workload_df['cluster_id'], categories=cluster_ids)
     
     # Set style for clean presentation
     plt.style.use('default')
@@ -120,8 +134,8 @@ def create_slide_summary(data_path):
     sriov_jobs = len(jobs_df[jobs_df['vf_req'] > 0])
     
     # Calculate total capacity
-    total_cpu = sum(clusters_df['cpu_cap'])
-    total_memory = sum(clusters_df['mem_cap']) / 1000  # Convert to GB
+    total_cpu = clusters_df['cpu_cap'].sum()
+    total_memory = clusters_df['mem_cap'].sum() / 1000  # Convert to GB
     
     # Max utilization
     max_cpu = max(cpu_utils)
@@ -191,9 +205,12 @@ Optimization Features:
     fig.text(0.99, 0.01, f'Generated: {timestamp}', ha='right', va='bottom', 
              fontsize=8, alpha=0.7)
     
-    # Save the slide-ready summary
-    output_file = Path(data_path) / f"{Path(data_path).name}_slide_summary.png"
-    plt.savefig(output_file, dpi=300, bbox_inches='tight', facecolor='white')
+    # Save the slide-ready summary, cropped to everything drawn (the bar labels
+    # overhang the axes) - measured from one draw instead of bbox_inches='tight'
+    fig.canvas.draw()
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+    output_file = data_dir / f"{dataset_name}_slide_summary.png"
+    plt.savefig(output_file, dpi=300, bbox_inches=bbox, facecolor='white')
     print(f"📊 Slide summary saved: {output_file}")
     
     return fig
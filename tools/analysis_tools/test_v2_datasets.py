@@ -5,22 +5,121 @@ Comprehensive test suite for enhanced M-DRA datasets with temporal analysis.
 
 import os
 import sys
+import atexit
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import subprocess
 import json
-from typing import Dict, List, Tuple
+import multiprocessing
+from collections import deque
+from contextlib import redirect_stderr, redirect_stdout
+import re
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+
+# Column dtypes for each dataset CSV. Only these columns are parsed; cpu and
+# memory stay float64 because converted real-world datasets carry fractional
+# values, while ids, VF counts and support flags fit small integer types.
+# None leaves a column to type inference, so integer loads stay integers.
+CLUSTERS_DTYPES = {'id': 'int32', 'mano_supported': 'int8', 'sriov_supported': 'int8'}
+NODES_DTYPES = {'id': 'int32', 'default_cluster': 'int32',
+                'cpu_cap': 'float64', 'mem_cap': 'float64', 'vf_cap': 'int32'}
+JOBS_DTYPES = {'id': 'int32', 'default_cluster': 'int32', 'cpu_req': 'float64',
+               'mem_req': 'float64', 'vf_req': 'int32', 'mano_req': 'int8'}
+CAP_DTYPES = {'id': 'int32', 'cpu_cap': 'float64', 'mem_cap': 'float64', 'vf_cap': 'int32',
+              'cpu_req': 'float64', 'mem_req': 'float64', 'vf_req': 'int32'}
+TEMPORAL_DTYPES = {'cluster_id': 'int32', 'timeslice': 'int32', 'cpu_load': None,
+                   'mem_load': None, 'job_count': 'int32'}
+
+# temporal_loads.csv grows with clusters x timeslices, so it is streamed
+# in chunks of this many rows instead of being loaded whole
+TEMPORAL_CHUNKSIZE = 1_000_000
+
+CSV_DTYPES = {
+    'clusters.csv': CLUSTERS_DTYPES,
+    'nodes.csv': NODES_DTYPES,
+    'jobs.csv': JOBS_DTYPES,
+    'clusters_cap.csv': CAP_DTYPES,
+    'temporal_loads.csv': TEMPORAL_DTYPES,
+}
+
+# Repository root, where the mdra_solver package lives
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# One single-worker pool per solver, created on first use by solver_pool()
+_SOLVER_POOLS = {}
+
+# Seconds a single solver run may take
+SOLVER_TIMEOUT = 60
+
+# mdra_solver.py result lines
+_OPTIMAL_RE = re.compile(r'Optimal relocations\s*=\s*([-+eE0-9.]+)')
+_STATUS_RE = re.compile(r'Solver status: (\w+)')
+
+
+def flatten_results(results: Dict, dataset_name: str) -> pd.DataFrame:
+    """Flatten a nested results dict into (dataset, metric, value, text) rows.
+    
+    Metrics are dotted paths into the results. Numbers and flags go to the
+    float `value` column; strings and lists (JSON-encoded) go to `text`.
+    """
+    flat = pd.json_normalize(results, sep='.').iloc[0]
+    
+    values = []
+    texts = []
+    for item in flat.tolist():
+        if np.isscalar(item) and not isinstance(item, str):
+            values.append(float(item))
+            texts.append(None)
+        else:
+            values.append(np.nan)
+            texts.append(None if item is None else
+                         item if isinstance(item, str) else json.dumps(item, default=str))
+    
+    return pd.DataFrame({
+        'dataset': dataset_name,
+        'metric': flat.index.astype(str),
+        'value': np.array(values, dtype=np.float64),
+        'text': texts
+    })
 
 
 class EnhancedDatasetTester:
     """Test suite for temporal M-DRA datasets."""
     
-    def __init__(self, dataset_path: str):
+    def __init__(self, dataset_path: str, parquet_cache: bool = False, json_report: bool = False):
         self.dataset_path = Path(dataset_path)
         self.dataset_name = self.dataset_path.name
         self.results = {}
         
+        # The report is a flat Parquet table; also write the nested JSON when asked
+        self.json_report = json_report
+        
+        # Parsed CSVs, keyed by filename, shared by every test
+        self._csv_cache: Dict[str, pd.DataFrame] = {}
+        
+        # Keep a .parquet sidecar next to each CSV and read it on later runs
+        self.parquet_cache = parquet_cache
+        
+        # Per-cluster temporal_loads statistics, built by one streamed pass
+        self._temporal_stats = None
+        
+        # clusters.csv / clusters_cap.csv rows keyed by cluster id
+        self._clusters_dict = None
+        self._cap_dict = None
+        
         # Required files for enhanced datasets
         self.required_files = [
             'clusters.csv',
@@ -32,6 +131,167 @@ class EnhancedDatasetTester:
             'temporal_loads.png'
         ]
     
+    def _load(self, name: str) -> pd.DataFrame:
+        """Return the DataFrame for a dataset CSV, parsing it only once."""
+        if name not in self._csv_cache:
+            self._csv_cache[name] = self._read(name)
+        return self._csv_cache[name]
+    
+    def _read(self, name: str) -> pd.DataFrame:
+        """Parse a dataset CSV, going through the Parquet sidecar when enabled."""
+        csv_path = self.dataset_path / name
+        pq_path = csv_path.with_suffix('.parquet')
+        
+        # A sidecar older than its CSV is stale and gets rewritten below
+        if (self.parquet_cache and pq_path.exists()
+                and pq_path.stat().st_mtime >= csv_path.stat().st_mtime):
+            try:
+                return pd.read_parquet(pq_path)
+            except ImportError:
+                pass
+        
+        dtypes = CSV_DTYPES[name]
+        if pa is not None:
+            # The pyarrow engine parses columns on several threads but takes no
+            # callable usecols, so pick the wanted columns from the header
+            columns = self._wanted_columns(csv_path, dtypes)
+            df = pd.read_csv(
+                csv_path,
+                engine='pyarrow',
+                dtype={col: dtypes[col] for col in columns if dtypes[col]},
+                usecols=columns
+            )
+        else:
+            df = pd.read_csv(
+                csv_path,
+                dtype={col: dtype for col, dtype in dtypes.items() if dtype},
+                usecols=lambda col: col in dtypes
+            )
+        
+        if self.parquet_cache:
+            try:
+                df.to_parquet(pq_path, compression='zstd', index=False)
+            except ImportError:
+                # No Parquet engine (pyarrow) installed - stay on CSV
+                self.parquet_cache = False
+        
+        return df
+    
+    def _cluster_rows(self) -> Dict[int, tuple]:
+        """clusters.csv rows as namedtuples keyed by cluster id."""
+        if self._clusters_dict is None:
+            clusters = self._load('clusters.csv')
+            self._clusters_dict = {row.id: row for row in clusters.itertuples(index=False)}
+        return self._clusters_dict
+    
+    def _cap_rows(self) -> Dict[int, tuple]:
+        """clusters_cap.csv rows as namedtuples keyed by cluster id."""
+        if self._cap_dict is None:
+            clusters_cap = self._load('clusters_cap.csv')
+            self._cap_dict = {row.id: row for row in clusters_cap.itertuples(index=False)}
+        return self._cap_dict
+    
+    @staticmethod
+    def _count_rows(csv_path: Path) -> int:
+        """Data rows in a CSV, counted from newlines in 1 MB blocks."""
+        newlines = 0
+        last = b'\n'
+        with open(csv_path, 'rb') as f:
+            for buf in iter(lambda: f.read(1 << 20), b''):
+                newlines += buf.count(b'\n')
+                last = buf[-1:]
+        # An unterminated last line is still a line; the header is not a row
+        lines = newlines + (last != b'\n')
+        return max(lines - 1, 0)
+    
+    @staticmethod
+    def _wanted_columns(csv_path: Path, dtypes: Dict[str, Optional[str]]) -> List[str]:
+        """Header columns of a CSV that have an entry in its dtype table."""
+        return [col for col in pd.read_csv(csv_path, nrows=0).columns if col in dtypes]
+    
+    def _temporal_chunks(self):
+        """Yield temporal_loads.csv as a sequence of bounded-size DataFrames."""
+        csv_path = self.dataset_path / 'temporal_loads.csv'
+        dtypes = TEMPORAL_DTYPES
+        
+        if pa is not None:
+            # Arrow's streaming reader decodes 8 MB blocks on multiple threads
+            columns = self._wanted_columns(csv_path, dtypes)
+            reader = pa_csv.open_csv(
+                csv_path,
+                read_options=pa_csv.ReadOptions(use_threads=True, block_size=8 << 20),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={col: pa.from_numpy_dtype(np.dtype(dtypes[col]))
+                                  for col in columns if dtypes[col]},
+                    include_columns=columns
+                )
+            )
+            for batch in reader:
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(
+                csv_path,
+                dtype={col: dtype for col, dtype in dtypes.items() if dtype},
+                usecols=lambda col: col in dtypes,
+                chunksize=TEMPORAL_CHUNKSIZE
+            )
+    
+    def _temporal_summary(self) -> pd.DataFrame:
+        """Per-cluster peaks, variance and peak timeslices of temporal_loads.csv.
+        
+        The file is streamed in bounded chunks (see _temporal_chunks) so memory
+        stays bounded: each chunk contributes its group count/mean/M2 (merged with
+        Chan's parallel variance formula) and the rows that hit its group
+        maxima, which are filtered against the final maxima at the end.
+        Clusters keep their order of first appearance in the file.
+        """
+        if self._temporal_stats is None:
+            partials = []
+            peak_candidates = []
+            for chunk in self._temporal_chunks():
+                by_cluster = chunk.groupby('cluster_id', sort=False)
+                partial = by_cluster.agg(
+                    n=('cpu_load', 'size'),
+                    max_cpu=('cpu_load', 'max'),
+                    max_mem=('mem_load', 'max'),
+                    max_jobs=('job_count', 'max'),
+                    cpu_mean=('cpu_load', 'mean'),
+                    mem_mean=('mem_load', 'mean'),
+                    cpu_var=('cpu_load', 'var'),
+                    mem_var=('mem_load', 'var')
+                )
+                partial['cpu_m2'] = partial['cpu_var'].fillna(0) * (partial['n'] - 1)
+                partial['mem_m2'] = partial['mem_var'].fillna(0) * (partial['n'] - 1)
+                partials.append(partial.drop(columns=['cpu_var', 'mem_var']))
+                
+                is_peak = ((chunk['cpu_load'] == by_cluster['cpu_load'].transform('max'))
+                           | (chunk['mem_load'] == by_cluster['mem_load'].transform('max')))
+                peak_candidates.append(chunk.loc[is_peak, ['cluster_id', 'timeslice', 'cpu_load', 'mem_load']])
+            
+            parts = pd.concat(partials)
+            by_cluster = parts.groupby(level=0, sort=False)
+            stats = by_cluster.agg(n=('n', 'sum'), max_cpu=('max_cpu', 'max'),
+                                   max_mem=('max_mem', 'max'), max_jobs=('max_jobs', 'max'))
+            stats.index.name = 'cluster_id'
+            
+            # Merge the per-chunk (n, mean, M2) triples into sample variances
+            n = parts['n']
+            for load in ('cpu', 'mem'):
+                mean = (parts[f'{load}_mean'] * n).groupby(level=0, sort=False).sum() / stats['n']
+                spread = parts[f'{load}_m2'] + n * (parts[f'{load}_mean'] - mean.reindex(parts.index)) ** 2
+                m2 = spread.groupby(level=0, sort=False).sum()
+                stats[f'{load}_var'] = (m2 / (stats['n'] - 1)).where(stats['n'] > 1)
+            
+            # Peak periods - candidate rows that match the overall maxima
+            candidates = pd.concat(peak_candidates)
+            for load, column in (('cpu', 'cpu_load'), ('mem', 'mem_load')):
+                overall_max = stats[f'max_{load}'].reindex(candidates['cluster_id']).to_numpy()
+                peaks = candidates.loc[candidates[column].to_numpy() == overall_max]
+                stats[f'peak_{load}_timeslices'] = peaks.groupby('cluster_id')['timeslice'].agg(list)
+            
+            self._temporal_stats = stats
+        return self._temporal_stats
+    
     def run_all_tests(self) -> Dict:
         """Run complete test suite."""
         print(f"🧪 Testing Enhanced Dataset: {self.dataset_name}")
@@ -74,14 +334,15 @@ class EnhancedDatasetTester:
             
             if filepath.exists():
                 if filename.endswith('.csv'):
-                    # Test CSV file validity
+                    # Test CSV file validity - header and line count only, the
+                    # full parse is left to the tests that need the data
                     try:
-                        df = pd.read_csv(filepath)
+                        columns = pd.read_csv(filepath, nrows=0).columns.tolist()
                         file_tests[filename] = {
                             'exists': True,
                             'readable': True,
-                            'rows': len(df),
-                            'columns': list(df.columns)
+                            'rows': self._count_rows(filepath),
+                            'columns': columns
                         }
                     except Exception as e:
                         file_tests[filename] = {
@@ -117,68 +378,73 @@ class EnhancedDatasetTester:
         print("\n🔍 Testing Data Integrity...")
         
         try:
-            clusters = pd.read_csv(self.dataset_path / 'clusters.csv')
-            nodes = pd.read_csv(self.dataset_path / 'nodes.csv')
-            jobs = pd.read_csv(self.dataset_path / 'jobs.csv')
-            clusters_cap = pd.read_csv(self.dataset_path / 'clusters_cap.csv')
-            temporal_loads = pd.read_csv(self.dataset_path / 'temporal_loads.csv')
+            clusters = self._load('clusters.csv')
+            nodes = self._load('nodes.csv')
+            jobs = self._load('jobs.csv')
+            clusters_cap = self._load('clusters_cap.csv')
+            temporal_stats = self._temporal_summary()
             
             integrity_tests = {}
             
-            # Test 1: Cluster ID consistency
-            cluster_ids_clusters = set(clusters['id'])
-            cluster_ids_cap = set(clusters_cap['id'])
-            cluster_ids_temporal = set(temporal_loads['cluster_id'])
+            # Test 1: Cluster ID consistency (sorted unique id arrays)
+            cluster_ids_clusters = np.unique(clusters['id'].to_numpy())
+            cluster_ids_cap = np.unique(clusters_cap['id'].to_numpy())
+            cluster_ids_temporal = np.unique(temporal_stats.index.to_numpy())
             
+            clusters_vs_cap = np.array_equal(cluster_ids_clusters, cluster_ids_cap)
+            clusters_vs_temporal = np.array_equal(cluster_ids_clusters, cluster_ids_temporal)
             integrity_tests['cluster_id_consistency'] = {
-                'clusters_vs_cap': cluster_ids_clusters == cluster_ids_cap,
-                'clusters_vs_temporal': cluster_ids_clusters == cluster_ids_temporal,
-                'all_consistent': cluster_ids_clusters == cluster_ids_cap == cluster_ids_temporal
+                'clusters_vs_cap': clusters_vs_cap,
+                'clusters_vs_temporal': clusters_vs_temporal,
+                'all_consistent': clusters_vs_cap and clusters_vs_temporal
             }
             
             # Test 2: Node-cluster references
-            node_clusters = set(nodes['default_cluster'])
-            invalid_node_clusters = node_clusters - cluster_ids_clusters
+            invalid_node_clusters = np.setdiff1d(nodes['default_cluster'].to_numpy(), cluster_ids_clusters)
             integrity_tests['node_cluster_refs'] = {
                 'valid': len(invalid_node_clusters) == 0,
-                'invalid_refs': list(invalid_node_clusters)
+                'invalid_refs': invalid_node_clusters.tolist()
             }
             
             # Test 3: Job-cluster references  
-            job_clusters = set(jobs['default_cluster'])
-            invalid_job_clusters = job_clusters - cluster_ids_clusters
+            invalid_job_clusters = np.setdiff1d(jobs['default_cluster'].to_numpy(), cluster_ids_clusters)
             integrity_tests['job_cluster_refs'] = {
                 'valid': len(invalid_job_clusters) == 0,
-                'invalid_refs': list(invalid_job_clusters)
+                'invalid_refs': invalid_job_clusters.tolist()
             }
             
-            # Test 4: Capacity calculations
-            calc_caps = []
-            for cluster_id in cluster_ids_clusters:
-                cluster_nodes = nodes[nodes['default_cluster'] == cluster_id]
-                cluster_jobs = jobs[jobs['default_cluster'] == cluster_id]
-                
-                calc_cpu_cap = cluster_nodes['cpu_cap'].sum()
-                calc_mem_cap = cluster_nodes['mem_cap'].sum()
-                calc_vf_cap = cluster_nodes['vf_cap'].sum()
-                
-                calc_cpu_req = cluster_jobs['cpu_req'].sum()
-                calc_mem_req = cluster_jobs['mem_req'].sum()
-                calc_vf_req = cluster_jobs['vf_req'].sum()
-                
-                cap_row = clusters_cap[clusters_cap['id'] == cluster_id].iloc[0]
-                
-                calc_caps.append({
-                    'cluster_id': cluster_id,
-                    'cpu_cap_match': calc_cpu_cap == cap_row['cpu_cap'],
-                    'mem_cap_match': calc_mem_cap == cap_row['mem_cap'],
-                    'vf_cap_match': calc_vf_cap == cap_row['vf_cap'],
-                    'cpu_req_match': calc_cpu_req == cap_row['cpu_req'],
-                    'mem_req_match': calc_mem_req == cap_row['mem_req'],
-                    'vf_req_match': calc_vf_req == cap_row['vf_req']
-                })
-            
-            integrity_tests['capacity_calculations'] = calc_caps
+            # Test 4: Capacity calculations - one groupby per table, aligned on cluster id
+            cluster_index = pd.Index(cluster_ids_clusters)
+            cap = clusters_cap.set_index('id').reindex(cluster_index)
+            node_sums = nodes.groupby('default_cluster')[['cpu_cap', 'mem_cap', 'vf_cap']].sum() \
+                .reindex(cluster_index, fill_value=0)
+            job_sums = jobs.groupby('default_cluster')[['cpu_req', 'mem_req', 'vf_req']].sum() \
+                .reindex(cluster_index, fill_value=0)
+            
+            # One comparison over every (cluster, field) pair
+            computed = node_sums.join(job_sums)
+            expected = cap[computed.columns]
+            match_matrix = computed.to_numpy() == expected.to_numpy()
+            all_match = bool(match_matrix.all())
+            
+            # Details only for the cells that disagree
+            mismatches = []
+            if not all_match:
+                rows, cols = np.nonzero(~match_matrix)
+                mismatches = [
+                    {
+                        'cluster_id': cluster_index[row].item(),
+                        'field': computed.columns[col],
+                        'computed': computed.iat[row, col].item(),
+                        'expected': expected.iat[row, col].item()
+                    }
+                    for row, col in zip(rows.tolist(), cols.tolist())
+                ]
+            
+            integrity_tests['capacity_calculations'] = {
+                'all_match': all_match,
+                'mismatches': mismatches
+            }
             
             self.results['data_integrity'] = integrity_tests
             
@@ -198,11 +464,7 @@ class EnhancedDatasetTester:
             else:
                 print("  ❌ Job-cluster references: FAIL")
                 
-            cap_matches = all(
-                all(c[key] for key in c.keys() if 'match' in key)
-                for c in calc_caps
-            )
-            if cap_matches:
+            if all_match:
                 print("  ✅ Capacity calculations: PASS")
             else:
                 print("  ❌ Capacity calculations: FAIL")
@@ -216,8 +478,8 @@ class EnhancedDatasetTester:
         print("\n📊 Testing Job Distribution...")
         
         try:
-            jobs = pd.read_csv(self.dataset_path / 'jobs.csv')
-            clusters = pd.read_csv(self.dataset_path / 'clusters.csv')
+            jobs = self._load('jobs.csv')
+            clusters = self._load('clusters.csv')
             
             # Calculate job distribution
             job_counts = jobs['default_cluster'].value_counts().sort_index()
@@ -267,47 +529,35 @@ class EnhancedDatasetTester:
         print("\n⏰ Testing Temporal Patterns...")
         
         try:
-            temporal_loads = pd.read_csv(self.dataset_path / 'temporal_loads.csv')
-            clusters_cap = pd.read_csv(self.dataset_path / 'clusters_cap.csv')
+            clusters_cap = self._load('clusters_cap.csv')
             
             temporal_tests = {}
             
-            for cluster_id in temporal_loads['cluster_id'].unique():
-                cluster_data = temporal_loads[temporal_loads['cluster_id'] == cluster_id]
-                cluster_cap = clusters_cap[clusters_cap['id'] == cluster_id].iloc[0]
-                
-                # Find peak loads
-                max_cpu = cluster_data['cpu_load'].max()
-                max_mem = cluster_data['mem_load'].max()
-                max_jobs = cluster_data['job_count'].max()
-                
-                # Calculate utilization percentages
-                cpu_cap = cluster_cap['cpu_cap']
-                mem_cap = cluster_cap['mem_cap']
-                
-                max_cpu_util = (max_cpu / cpu_cap * 100) if cpu_cap > 0 else 0
-                max_mem_util = (max_mem / mem_cap * 100) if mem_cap > 0 else 0
-                
-                # Find peak periods
-                peak_cpu_times = cluster_data[cluster_data['cpu_load'] == max_cpu]['timeslice'].tolist()
-                peak_mem_times = cluster_data[cluster_data['mem_load'] == max_mem]['timeslice'].tolist()
-                
-                # Analyze load variance (temporal variation)
-                cpu_variance = cluster_data['cpu_load'].var()
-                mem_variance = cluster_data['mem_load'].var()
-                
+            # Peaks, variance and peak periods for every cluster, from one streamed pass
+            agg = self._temporal_summary().copy()
+            cap = clusters_cap.set_index('id').loc[agg.index, ['cpu_cap', 'mem_cap']]
+            
+            # Calculate utilization percentages
+            cpu_cap = cap['cpu_cap'].to_numpy()
+            mem_cap = cap['mem_cap'].to_numpy()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                agg['max_cpu_util'] = np.where(cpu_cap > 0, agg['max_cpu'].to_numpy() / cpu_cap * 100, 0)
+                agg['max_mem_util'] = np.where(mem_cap > 0, agg['max_mem'].to_numpy() / mem_cap * 100, 0)
+            
+            for row in agg.itertuples():
+                cluster_id = row.Index
                 temporal_tests[f'cluster_{cluster_id}'] = {
-                    'max_cpu_load': max_cpu,
-                    'max_mem_load': max_mem,
-                    'max_concurrent_jobs': max_jobs,
-                    'max_cpu_utilization': max_cpu_util,
-                    'max_mem_utilization': max_mem_util,
-                    'peak_cpu_timeslices': peak_cpu_times,
-                    'peak_mem_timeslices': peak_mem_times,
-                    'cpu_variance': cpu_variance,
-                    'mem_variance': mem_variance,
-                    'has_temporal_variation': cpu_variance > 0 or mem_variance > 0,
-                    'has_high_load_periods': max_cpu_util > 70 or max_mem_util > 70
+                    'max_cpu_load': row.max_cpu,
+                    'max_mem_load': row.max_mem,
+                    'max_concurrent_jobs': row.max_jobs,
+                    'max_cpu_utilization': row.max_cpu_util,
+                    'max_mem_utilization': row.max_mem_util,
+                    'peak_cpu_timeslices': row.peak_cpu_timeslices,
+                    'peak_mem_timeslices': row.peak_mem_timeslices,
+                    'cpu_variance': row.cpu_var,
+                    'mem_variance': row.mem_var,
+                    'has_temporal_variation': row.cpu_var > 0 or row.mem_var > 0,
+                    'has_high_load_periods': row.max_cpu_util > 70 or row.max_mem_util > 70
                 }
             
             self.results['temporal_patterns'] = temporal_tests
@@ -339,42 +589,34 @@ class EnhancedDatasetTester:
         print("\n🔒 Testing Constraint Compliance...")
         
         try:
-            jobs = pd.read_csv(self.dataset_path / 'jobs.csv')
-            clusters = pd.read_csv(self.dataset_path / 'clusters.csv')
+            jobs = self._load('jobs.csv')
+            cluster_rows = self._cluster_rows()
+            
+            # Attach each job's cluster support flags, then check every job at once
+            merged = jobs.assign(
+                mano_supported=jobs['default_cluster'].map(
+                    {cid: row.mano_supported for cid, row in cluster_rows.items()}),
+                sriov_supported=jobs['default_cluster'].map(
+                    {cid: row.sriov_supported for cid, row in cluster_rows.items()})
+            )
+            mano_jobs = merged['mano_req'] == 1
+            sriov_jobs = merged['vf_req'] > 0
+            mano_mask = mano_jobs & (merged['mano_supported'] == 0)
+            sriov_mask = sriov_jobs & (merged['sriov_supported'] == 0)
             
             constraint_tests = {
-                'mano_violations': [],
-                'sriov_violations': [],
-                'total_mano_jobs': 0,
-                'total_sriov_jobs': 0
+                'mano_violations': merged.loc[mano_mask, ['id', 'default_cluster', 'mano_req', 'mano_supported']]
+                    .rename(columns={'id': 'job_id', 'default_cluster': 'cluster_id',
+                                     'mano_supported': 'cluster_mano_support'})
+                    .to_dict('records'),
+                'sriov_violations': merged.loc[sriov_mask, ['id', 'default_cluster', 'vf_req', 'sriov_supported']]
+                    .rename(columns={'id': 'job_id', 'default_cluster': 'cluster_id',
+                                     'sriov_supported': 'cluster_sriov_support'})
+                    .to_dict('records'),
+                'total_mano_jobs': int(mano_jobs.sum()),
+                'total_sriov_jobs': int(sriov_jobs.sum())
             }
             
-            for _, job in jobs.iterrows():
-                cluster_id = job['default_cluster']
-                cluster = clusters[clusters['id'] == cluster_id].iloc[0]
-                
-                # Check MANO constraint
-                if job['mano_req'] == 1:
-                    constraint_tests['total_mano_jobs'] += 1
-                    if cluster['mano_supported'] == 0:
-                        constraint_tests['mano_violations'].append({
-                            'job_id': job['id'],
-                            'cluster_id': cluster_id,
-                            'mano_req': job['mano_req'],
-                            'cluster_mano_support': cluster['mano_supported']
-                        })
-                
-                # Check SR-IOV constraint
-                if job['vf_req'] > 0:
-                    constraint_tests['total_sriov_jobs'] += 1
-                    if cluster['sriov_supported'] == 0:
-                        constraint_tests['sriov_violations'].append({
-                            'job_id': job['id'],
-                            'cluster_id': cluster_id,
-                            'vf_req': job['vf_req'],
-                            'cluster_sriov_support': cluster['sriov_supported']
-                        })
-            
             constraint_tests['mano_compliance'] = len(constraint_tests['mano_violations']) == 0
             constraint_tests['sriov_compliance'] = len(constraint_tests['sriov_violations']) == 0
             constraint_tests['full_compliance'] = (
@@ -401,71 +643,57 @@ class EnhancedDatasetTester:
             print(f"  ❌ Constraint compliance test failed: {e}")
             self.results['constraint_compliance'] = {'error': str(e)}
     
+    def _solver_test(self, run) -> Dict:
+        """Turn a margin 1.0 solver run, or the exception it raised, into a test result."""
+        if isinstance(run, subprocess.TimeoutExpired):
+            return {
+                'success': False,
+                'error': 'timeout',
+                'execution_time': 'timeout'
+            }
+        
+        if isinstance(run, Exception):
+            return {
+                'success': False,
+                'error': str(run)
+            }
+        
+        solver_test = {
+            'success': run['returncode'] == 0,
+            'solver_status': run['solver_status'],
+            'output_tail': run['output_tail'],
+            'execution_time': 'within_timeout'
+        }
+        
+        # Record optimal value if successful
+        if run['returncode'] == 0 and run['optimal_value'] is not None:
+            solver_test['optimal_value'] = run['optimal_value']
+        
+        return solver_test
+    
     def test_solver_compatibility(self):
         """Test compatibility with M-DRA solvers."""
         print("\n🔧 Testing Solver Compatibility...")
         
         solver_tests = {}
+        solvers = ['solver_x', 'solver_y', 'solver_xy']
         
-        # Test each solver
-        for solver in ['solver_x', 'solver_y', 'solver_xy']:
+        # Run all three (margin 1.0) side by side in the warm solver workers and
+        # report them in order once they are collected
+        runs = run_solvers([(str(self.dataset_path), solver, 1.0) for solver in solvers])
+        for solver, run in zip(solvers, runs):
+            solver_test = self._solver_test(run)
+            solver_tests[solver] = solver_test
             print(f"  Testing {solver}...")
             
-            try:
-                # Run solver with margin 1.0
-                solver_mode = solver.replace('solver_', '')  # Convert solver_x to x
-                cmd = [
-                    'python', 'mdra_solver.py',
-                    str(self.dataset_path),
-                    '--mode', solver_mode,
-                    '--margin', '1.0'
-                ]
-                
-                result = subprocess.run(
-                    cmd, 
-                    capture_output=True, 
-                    text=True,
-                    timeout=60,  # 60 second timeout
-                    cwd=Path.cwd()
-                )
-                
-                solver_tests[solver] = {
-                    'success': result.returncode == 0,
-                    'stdout': result.stdout,
-                    'stderr': result.stderr,
-                    'execution_time': 'within_timeout'
-                }
-                
-                # Parse optimal value if successful
-                if result.returncode == 0:
-                    output_lines = result.stdout.split('\n')
-                    for line in output_lines:
-                        if 'Optimal relocations =' in line:
-                            try:
-                                optimal_value = float(line.split('=')[1].strip())
-                                solver_tests[solver]['optimal_value'] = optimal_value
-                            except:
-                                pass
-                
-                if result.returncode == 0:
-                    print(f"    ✅ {solver}: SUCCESS")
-                else:
-                    print(f"    ❌ {solver}: FAILED")
-                    
-            except subprocess.TimeoutExpired:
-                solver_tests[solver] = {
-                    'success': False,
-                    'error': 'timeout',
-                    'execution_time': 'timeout'
-                }
+            if solver_test['success']:
+                print(f"    ✅ {solver}: SUCCESS")
+            elif solver_test.get('error') == 'timeout':
                 print(f"    ⏰ {solver}: TIMEOUT")
-                
-            except Exception as e:
-                solver_tests[solver] = {
-                    'success': False,
-                    'error': str(e)
-                }
-                print(f"    ❌ {solver}: ERROR - {e}")
+            elif 'error' in solver_test:
+                print(f"    ❌ {solver}: ERROR - {solver_test['error']}")
+            else:
+                print(f"    ❌ {solver}: FAILED")
         
         self.results['solver_compatibility'] = solver_tests
         
@@ -478,8 +706,8 @@ class EnhancedDatasetTester:
         print("\n🚀 Testing Performance Metrics...")
         
         try:
-            clusters_cap = pd.read_csv(self.dataset_path / 'clusters_cap.csv')
-            temporal_loads = pd.read_csv(self.dataset_path / 'temporal_loads.csv')
+            clusters_cap = self._load('clusters_cap.csv')
+            temporal_stats = self._temporal_summary()
             
             # Overall utilization metrics
             total_cpu_cap = clusters_cap['cpu_cap'].sum()
@@ -496,30 +724,30 @@ class EnhancedDatasetTester:
             
             # Temporal peak analysis
             temporal_peaks = {}
-            for cluster_id in clusters_cap['id']:
-                cluster_temporal = temporal_loads[temporal_loads['cluster_id'] == cluster_id]
-                cluster_cap = clusters_cap[clusters_cap['id'] == cluster_id].iloc[0]
-                
-                if not cluster_temporal.empty:
-                    max_cpu_load = cluster_temporal['cpu_load'].max()
-                    max_mem_load = cluster_temporal['mem_load'].max()
+            peak_loads = temporal_stats[['max_cpu', 'max_mem']]
+            for cluster_id, cluster_cap in self._cap_rows().items():
+                if cluster_id in peak_loads.index:
+                    max_cpu_load = peak_loads.at[cluster_id, 'max_cpu']
+                    max_mem_load = peak_loads.at[cluster_id, 'max_mem']
                     
                     temporal_peaks[cluster_id] = {
-                        'peak_cpu_utilization': (max_cpu_load / cluster_cap['cpu_cap'] * 100) if cluster_cap['cpu_cap'] > 0 else 0,
-                        'peak_mem_utilization': (max_mem_load / cluster_cap['mem_cap'] * 100) if cluster_cap['mem_cap'] > 0 else 0
+                        'peak_cpu_utilization': (max_cpu_load / cluster_cap.cpu_cap * 100) if cluster_cap.cpu_cap > 0 else 0,
+                        'peak_mem_utilization': (max_mem_load / cluster_cap.mem_cap * 100) if cluster_cap.mem_cap > 0 else 0
                     }
             
-            # Load balancing analysis
-            cluster_utilizations = []
-            for _, cluster in clusters_cap.iterrows():
-                if cluster['cpu_cap'] > 0:
-                    cpu_util = cluster['cpu_req'] / cluster['cpu_cap'] * 100
-                    mem_util = cluster['mem_req'] / cluster['mem_cap'] * 100
-                    cluster_utilizations.append(max(cpu_util, mem_util))
+            # Load balancing analysis - busiest resource per cluster with CPU capacity
+            active = clusters_cap[clusters_cap['cpu_cap'] > 0]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cpu_utils = active['cpu_req'].to_numpy(dtype=np.float64) / active['cpu_cap'].to_numpy(dtype=np.float64) * 100
+                mem_utils = active['mem_req'].to_numpy(dtype=np.float64) / active['mem_cap'].to_numpy(dtype=np.float64) * 100
+            cluster_utilizations = np.maximum(cpu_utils, mem_utils)
             
-            if cluster_utilizations:
-                load_balance_score = min(cluster_utilizations) / max(cluster_utilizations) if max(cluster_utilizations) > 0 else 1.0
+            if cluster_utilizations.size:
+                min_util = float(cluster_utilizations.min())
+                max_util = float(cluster_utilizations.max())
+                load_balance_score = min_util / max_util if max_util > 0 else 1.0
             else:
+                min_util = max_util = 0.0
                 load_balance_score = 1.0
             
             performance_metrics = {
@@ -531,9 +759,9 @@ class EnhancedDatasetTester:
                 'temporal_peaks': temporal_peaks,
                 'load_balance_score': load_balance_score,
                 'optimization_potential': {
-                    'has_high_util_clusters': any(u > 80 for u in cluster_utilizations),
-                    'has_low_util_clusters': any(u < 30 for u in cluster_utilizations),
-                    'util_range': max(cluster_utilizations) - min(cluster_utilizations) if cluster_utilizations else 0
+                    'has_high_util_clusters': bool((cluster_utilizations > 80).any()),
+                    'has_low_util_clusters': bool((cluster_utilizations < 30).any()),
+                    'util_range': max_util - min_util
                 }
             }
             
@@ -552,20 +780,47 @@ class EnhancedDatasetTester:
         """Generate comprehensive test report."""
         print("\n📋 Generating Test Report...")
         
-        report_path = self.dataset_path / f"test_report_{self.dataset_name}.json"
+        report_path = self.dataset_path / f"test_report_{self.dataset_name}.parquet"
+        write_json = self.json_report
         
         try:
-            with open(report_path, 'w') as f:
-                json.dump(self.results, f, indent=2, default=str)
-            
+            flatten_results(self.results, self.dataset_name).to_parquet(
+                report_path, compression='zstd', index=False)
             print(f"  ✅ Test report saved: {report_path}")
-            
+        except ImportError:
+            # No Parquet engine (pyarrow) installed - fall back to JSON
+            write_json = True
         except Exception as e:
             print(f"  ❌ Failed to save test report: {e}")
         
+        if write_json:
+            self.write_json_report()
+        
         # Print summary
         self.print_test_summary()
     
+    def write_json_report(self):
+        """Write the nested results as indented JSON."""
+        report_path = self.dataset_path / f"test_report_{self.dataset_name}.json"
+        
+        try:
+            if orjson is not None:
+                # Native numpy scalar support; int cluster ids are valid keys
+                with open(report_path, 'wb') as f:
+                    f.write(orjson.dumps(
+                        self.results,
+                        default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                    ))
+            else:
+                with open(report_path, 'w') as f:
+                    json.dump(self.results, f, indent=2, default=str)
+            
+            print(f"  ✅ Test report saved: {report_path}")
+            
+        except Exception as e:
+            print(f"  ❌ Failed to save test report: {e}")
+    
     def print_test_summary(self):
         """Print test summary."""
         print("\n" + "="*60)
@@ -624,64 +879,200 @@ class EnhancedDatasetTester:
             print(f"\n✅ OVERALL: DATASET READY FOR PRODUCTION")
 
 
-def main():
-    """Run enhanced dataset tests."""
-    import argparse
+class SolverOutput:
+    """File-like sink that scans solver output line by line as it is printed.
     
-    parser = argparse.ArgumentParser(description='Test enhanced M-DRA datasets')
-    parser.add_argument('dataset', help='Dataset path to test')
-    parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    Only the result lines and the last few lines of output are kept.
+    """
     
-    args = parser.parse_args()
+    def __init__(self, tail_lines: int = 20):
+        self.optimal_value = None
+        self.solver_status = 'unknown'
+        self._tail = deque(maxlen=tail_lines)
+        self._partial = ''
     
-    if not Path(args.dataset).exists():
-        print(f"Error: Dataset path does not exist: {args.dataset}")
-        return 1
+    def write(self, text: str) -> int:
+        lines = (self._partial + text).split('\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self._scan(line)
+        return len(text)
     
-    tester = EnhancedDatasetTester(args.dataset)
-    results = tester.run_all_tests()
+    def flush(self):
+        pass
     
-    return 0
+    def _scan(self, line: str):
+        self._tail.append(line + '\n')
+        if self.optimal_value is None:
+            optimal_match = _OPTIMAL_RE.search(line)
+            if optimal_match:
+                try:
+                    self.optimal_value = float(optimal_match.group(1))
+                except ValueError:
+                    pass
+        if self.solver_status == 'unknown':
+            status_match = _STATUS_RE.search(line)
+            if status_match:
+                self.solver_status = status_match.group(1)
+    
+    @property
+    def output_tail(self) -> str:
+        return ''.join(self._tail) + self._partial
 
 
-if __name__ == '__main__':
-    exit(main())
+def _init_solver_worker():
+    """Make the solver modules importable and import them once per worker."""
+    for path in (REPO_ROOT, REPO_ROOT / 'tools' / 'solver_tools'):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+    
+    # Warm-up only: a solver that fails to import is reported by its own run
+    try:
+        import simple_solver_cli
+        from mdra_solver import solver_x, solver_y, solver_xy
+    except ImportError:
+        pass
 
-def main():
-    print("🧪 M-DRA v2 Dataset Comprehensive Testing")
+
+def solver_pool(solver: str):
+    """Long-lived worker for one solver, which keeps the solvers imported between runs."""
+    if solver not in _SOLVER_POOLS:
+        _SOLVER_POOLS[solver] = multiprocessing.Pool(1, initializer=_init_solver_worker)
+    return _SOLVER_POOLS[solver]
+
+
+@atexit.register
+def _close_solver_pools():
+    """Stop the idle solver workers before the interpreter tears down."""
+    while _SOLVER_POOLS:
+        _SOLVER_POOLS.popitem()[1].terminate()
+
+
+def run_solvers(runs: List[Tuple[str, str, float]]) -> List:
+    """Run each (dataset, solver, margin) in that solver's worker; return the outcomes in order.
+    
+    An outcome is the solve_in_process() result or the exception it raised.
+    The solvers run side by side, one run each at a time. A run still going
+    after SOLVER_TIMEOUT seconds gets subprocess.TimeoutExpired and its
+    worker is terminated; the next run of that solver starts a fresh one.
+    """
+    outcomes = [None] * len(runs)
+    queued = {}
+    for i, (dataset, solver, margin) in enumerate(runs):
+        queued.setdefault(solver, deque()).append(i)
+    
+    while queued:
+        in_flight = []
+        for solver, indices in list(queued.items()):
+            i = indices.popleft()
+            if not indices:
+                del queued[solver]
+            in_flight.append((i, solver, solver_pool(solver).apply_async(solve_in_process, runs[i])))
+        
+        for i, solver, result in in_flight:
+            try:
+                outcomes[i] = result.get(timeout=SOLVER_TIMEOUT)
+            except multiprocessing.TimeoutError:
+                _SOLVER_POOLS.pop(solver).terminate()
+                outcomes[i] = subprocess.TimeoutExpired(solver, SOLVER_TIMEOUT)
+            except Exception as e:
+                outcomes[i] = e
+    
+    return outcomes
+
+
+def solve_in_process(dataset: str, solver: str, margin: float) -> Dict:
+    """Run one solver in this process, the way `mdra_solver.py --mode` does.
+    
+    Meant to be run through run_solvers(), whose warm workers skip the
+    interpreter start-up and numpy/pandas/cvxpy imports of a fresh
+    `python mdra_solver.py`.
+    """
+    _init_solver_worker()
+    from simple_solver_cli import run_solver
+    
+    solver_mode = solver.replace('solver_', '')  # Convert solver_x to x
+    output = SolverOutput()
+    succeeded = False
+    try:
+        with redirect_stdout(output), redirect_stderr(output):
+            succeeded = run_solver(dataset, solver_mode, 'results', margin)
+    except SystemExit as e:
+        # The solvers sys.exit() on invalid input; that ends this run, not the worker
+        succeeded = e.code in (None, 0)
+    except Exception as e:
+        print(f"❌ solver_{solver_mode} failed: {e}", file=output)
+    
+    return {
+        'returncode': 0 if succeeded else 1,
+        'optimal_value': output.optimal_value,
+        'solver_status': output.solver_status,
+        'output_tail': output.output_tail
+    }
+
+
+def solver_run_result(run) -> Dict:
+    """Convert a run_solvers() outcome into a solver grid result."""
+    if isinstance(run, subprocess.TimeoutExpired):
+        return {'status': 'TIMEOUT', 'cost': None, 'solver_status': 'timeout'}
+    if isinstance(run, Exception):
+        return {'status': 'ERROR', 'cost': None, 'solver_status': 'error', 'error': str(run)}
+    
+    if run['returncode'] == 0 and run['optimal_value'] is not None:
+        return {'status': 'SUCCESS', 'cost': run['optimal_value'], 'solver_status': run['solver_status']}
+    
+    return {'status': 'FAILED', 'cost': None, 'solver_status': run['solver_status']}
+
+
+def solver_grid_result(solver_test: Dict) -> Dict:
+    """Convert a test_solver_compatibility entry into a solver grid result."""
+    if solver_test.get('error') == 'timeout':
+        return {'status': 'TIMEOUT', 'cost': None, 'solver_status': 'timeout'}
+    if 'error' in solver_test:
+        return {'status': 'ERROR', 'cost': None, 'solver_status': 'error', 'error': solver_test['error']}
+    if solver_test['success'] and 'optimal_value' in solver_test:
+        return {'status': 'SUCCESS', 'cost': solver_test['optimal_value'], 'solver_status': solver_test['solver_status']}
+    return {'status': 'FAILED', 'cost': None, 'solver_status': solver_test['solver_status']}
+
+
+def run_solver_grid(testers: List[EnhancedDatasetTester], margins: List[float], solvers: List[str]):
+    """Run every (dataset, margin, solver) combination and print the comparison."""
+    print("\n🧪 M-DRA v2 Solver Grid")
     print("=" * 60)
     
-    # Test datasets
-    datasets = [
-        'data/sample-0-small-v2',
-        'data/sample-0-large-v2',
-        'data/sample-1-medium-v2', 
-        'data/sample-1-xlarge-v2'
-    ]
+    results = {tester.dataset_name: {margin: {} for margin in margins} for tester in testers}
     
-    solvers = ['solver_x', 'solver_y', 'solver_xy']
-    margins = [1.0, 0.9, 0.8, 0.7]
+    # test_solver_compatibility already ran each solver at margin 1.0 - reuse
+    # those runs and only launch the remaining combinations
+    tasks = []
+    for tester in testers:
+        solver_tests = tester.results.get('solver_compatibility', {})
+        for margin in margins:
+            for solver in solvers:
+                if margin == 1.0 and solver in solver_tests:
+                    results[tester.dataset_name][margin][solver] = solver_grid_result(solver_tests[solver])
+                else:
+                    tasks.append((tester, margin, solver))
     
-    results = {}
+    # Every remaining run is independent - hand them all to the warm solver workers
+    runs = run_solvers([(str(tester.dataset_path), solver, margin) for tester, margin, solver in tasks])
+    for (tester, margin, solver), run in zip(tasks, runs):
+        results[tester.dataset_name][margin][solver] = solver_run_result(run)
     
-    for dataset in datasets:
-        dataset_name = Path(dataset).name
+    # Report in grid order once everything has finished
+    for dataset_name in results:
         print(f"\n📊 Testing {dataset_name}")
-        results[dataset_name] = {}
         
         for margin in margins:
             print(f"  Margin {margin}:")
-            results[dataset_name][margin] = {}
             
             for solver in solvers:
-                print(f"    {solver}...", end='', flush=True)
-                result = run_solver_test(dataset, solver, margin)
-                results[dataset_name][margin][solver] = result
+                result = results[dataset_name][margin][solver]
                 
                 if result['status'] == 'SUCCESS':
-                    print(f" ✅ Cost: {result['cost']}")
+                    print(f"    {solver}... ✅ Cost: {result['cost']}")
                 else:
-                    print(f" ❌ {result['status']}")
+                    print(f"    {solver}... ❌ {result['status']}")
     
     # Summary analysis
     print(f"\n📈 RESULTS SUMMARY")
@@ -695,11 +1086,12 @@ def main():
             costs = {solver: result.get('cost') for solver, result in margin_results.items() 
                     if result.get('cost') is not None}
             
-            if len(costs) == 3:  # All solvers succeeded
-                print(f"  Margin {margin}: X={costs['solver_x']:.1f}, Y={costs['solver_y']:.1f}, XY={costs['solver_xy']:.1f}")
+            if len(costs) == len(solvers):  # All solvers succeeded
+                print(f"  Margin {margin}: " + ", ".join(
+                    f"{solver.replace('solver_', '').upper()}={costs[solver]:.1f}" for solver in solvers))
                 
                 # Calculate improvement
-                if costs['solver_y'] > 0:
+                if 'solver_y' in costs and 'solver_xy' in costs and costs['solver_y'] > 0:
                     improvement = (costs['solver_y'] - costs['solver_xy']) / costs['solver_y'] * 100
                     print(f"    → Joint optimization improvement: {improvement:.1f}%")
             else:
@@ -711,7 +1103,7 @@ def main():
     print("=" * 60)
     
     validation_passed = 0
-    total_tests = len(datasets) * len(margins) * len(solvers)
+    total_tests = len(testers) * len(margins) * len(solvers)
     
     for dataset_name in results:
         for margin in margins:
@@ -726,6 +1118,46 @@ def main():
         print("🎉 ALL TESTS PASSED - V2 datasets are working perfectly!")
     else:
         print(f"⚠️  {total_tests - validation_passed} tests failed - review needed")
+    
+    return results
+
+
+def main():
+    """Run enhanced dataset tests."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Test enhanced M-DRA datasets')
+    parser.add_argument('datasets', nargs='+', help='Dataset path(s) to test')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--enable-parquet-cache', action='store_true',
+                        help='Cache parsed CSVs as .parquet files next to them (requires pyarrow)')
+    parser.add_argument('--json-report', action='store_true',
+                        help='Also write the nested test_report_<dataset>.json')
+    parser.add_argument('--margins', help='Comma-separated margins for a solver grid run, e.g. 1.0,0.9,0.8,0.7')
+    parser.add_argument('--solvers', default='x,y,xy', help='Comma-separated solver modes for the grid (default: x,y,xy)')
+    
+    args = parser.parse_args()
+    
+    for dataset in args.datasets:
+        if not Path(dataset).exists():
+            print(f"Error: Dataset path does not exist: {dataset}")
+            return 1
+    
+    # One tester per dataset; the grid below reuses its results
+    testers = []
+    for dataset in args.datasets:
+        tester = EnhancedDatasetTester(dataset, parquet_cache=args.enable_parquet_cache,
+                                       json_report=args.json_report)
+        tester.run_all_tests()
+        testers.append(tester)
+    
+    if args.margins:
+        margins = [float(margin) for margin in args.margins.split(',')]
+        solvers = [f"solver_{mode.strip()}" for mode in args.solvers.split(',')]
+        run_solver_grid(testers, margins, solvers)
+    
+    return 0
+
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    exit(main())
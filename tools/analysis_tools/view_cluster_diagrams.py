@@ -3,26 +3,153 @@
 View cluster diagrams for M-DRA datasets.
 """
 
-import os
 import argparse
+import os
+import shutil
+import subprocess
+import numpy as np
+import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 
+# Columns read from each dataset CSV; None leaves the dtype to inference so
+# loads print exactly as written in the file
+CSV_COLUMNS = {
+    'clusters_cap.csv': {'id': 'int32', 'cpu_cap': None, 'mem_cap': None, 'vf_cap': 'int32',
+                         'cpu_req': None, 'mem_req': None, 'vf_req': 'int32',
+                         'mano_supported': 'int8', 'sriov_supported': 'int8'},
+    'temporal_loads.csv': {'cluster_id': 'int32', 'timeslice': 'int32',
+                           'cpu_load': None, 'mem_load': None, 'job_count': 'int32'},
+}
+
+# temporal_loads.csv grows with clusters x timeslices, so it is read in
+# chunks of this many rows
+TEMPORAL_CHUNKSIZE = 50_000
+
+# Desktop file opener, if this host has one
+_XDG_OPEN = shutil.which('xdg-open')
+
+@lru_cache(maxsize=64)
+def _read_csv_cached(path_str, mtime):
+    """Parse a CSV once per (path, mtime); rewriting the file changes the key."""
+    columns = CSV_COLUMNS.get(Path(path_str).name)
+    if columns is None:
+        return pd.read_csv(path_str)
+    return pd.read_csv(
+        path_str,
+        usecols=lambda col: col in columns,
+        dtype={col: dtype for col, dtype in columns.items() if dtype},
+        engine='c'
+    )
+
+def _running_max(acc, cluster_ids, values):
+    """Fold `values` into a per-cluster running maximum indexed by cluster id."""
+    n = int(cluster_ids.max()) + 1
+    dtype = values.dtype if acc is None else np.result_type(acc.dtype, values.dtype)
+    if acc is None or len(acc) < n or acc.dtype != dtype:
+        fill = np.iinfo(dtype).min if np.issubdtype(dtype, np.integer) else -np.inf
+        grown = np.full(max(n, 0 if acc is None else len(acc)), fill, dtype=dtype)
+        if acc is not None:
+            grown[:len(acc)] = acc
+        acc = grown
+    np.maximum.at(acc, cluster_ids, values)
+    return acc
+
+@lru_cache(maxsize=64)
+def _temporal_peaks_cached(path_str, mtime):
+    """Per-cluster maxima and peak timeslices from one chunked pass over temporal_loads.csv."""
+    columns = CSV_COLUMNS['temporal_loads.csv']
+    reader = pd.read_csv(
+        path_str,
+        usecols=lambda col: col in columns,
+        dtype={col: dtype for col, dtype in columns.items() if dtype},
+        chunksize=TEMPORAL_CHUNKSIZE
+    )
+    
+    # Running maxima per cluster id, plus the rows that matched them when read
+    max_cpu = max_mem = max_jobs = None
+    cpu_candidates = []
+    mem_candidates = []
+    for chunk in reader:
+        if chunk.empty:
+            continue
+        cluster_ids = chunk['cluster_id'].to_numpy()
+        timeslices = chunk['timeslice'].to_numpy()
+        cpu = chunk['cpu_load'].to_numpy()
+        mem = chunk['mem_load'].to_numpy()
+        
+        max_cpu = _running_max(max_cpu, cluster_ids, cpu)
+        max_mem = _running_max(max_mem, cluster_ids, mem)
+        max_jobs = _running_max(max_jobs, cluster_ids, chunk['job_count'].to_numpy())
+        
+        # Only rows at the maximum so far can be at the overall maximum
+        is_cpu_peak = cpu == max_cpu[cluster_ids]
+        is_mem_peak = mem == max_mem[cluster_ids]
+        cpu_candidates.append((cluster_ids[is_cpu_peak], timeslices[is_cpu_peak], cpu[is_cpu_peak]))
+        mem_candidates.append((cluster_ids[is_mem_peak], timeslices[is_mem_peak], mem[is_mem_peak]))
+    
+    if max_cpu is None:
+        return pd.DataFrame(columns=['cpu_load', 'mem_load', 'job_count']), {}, {}
+    
+    # Clusters that appear in the file; the others still hold the fill value
+    present = np.zeros(len(max_jobs), dtype=bool)
+    for candidates in cpu_candidates:
+        present[candidates[0]] = True
+    cluster_index = np.flatnonzero(present)
+    maxes = pd.DataFrame({
+        'cpu_load': max_cpu[cluster_index],
+        'mem_load': max_mem[cluster_index],
+        'job_count': max_jobs[cluster_index]
+    }, index=cluster_index)
+    
+    def peak_times(candidates, overall):
+        # Keep the candidates that reach the overall maximum, in file order
+        cluster_ids, timeslices, values = (np.concatenate(parts) for parts in zip(*candidates))
+        is_peak = values == overall[cluster_ids]
+        peaks = {}
+        for cluster_id, timeslice in zip(cluster_ids[is_peak].tolist(), timeslices[is_peak].tolist()):
+            peaks.setdefault(cluster_id, []).append(timeslice)
+        return peaks
+    
+    return maxes, peak_times(cpu_candidates, max_cpu), peak_times(mem_candidates, max_mem)
+
+def temporal_peaks(path):
+    """Return (maxes, peak_cpu_times, peak_mem_times) for a temporal_loads.csv."""
+    path = Path(path).resolve()
+    return _temporal_peaks_cached(str(path), path.stat().st_mtime)
+
+def read_csv(path):
+    """Read a dataset CSV, reusing the parse from an earlier call when unchanged."""
+    path = Path(path).resolve()
+    return _read_csv_cached(str(path), path.stat().st_mtime).copy(deep=False)
+
+def _xdg_open(path):
+    """Open a file in the default viewer, detached so we don't wait on it."""
+    if _XDG_OPEN is None:
+        return
+    subprocess.Popen(
+        [_XDG_OPEN, str(path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True
+    )
+
 def list_datasets_with_diagrams():
     """List all datasets that have cluster diagrams."""
-    data_dir = Path("data")
     datasets = []
     
-    if not data_dir.exists():
+    if not os.path.isdir("data"):
         print("No data directory found.")
         return datasets
     
-    for dataset_dir in data_dir.iterdir():
-        if dataset_dir.is_dir():
-            diagram_path = dataset_dir / "cluster_diagram.png"
-            if diagram_path.exists():
-                datasets.append(dataset_dir.name)
+    # scandir entries carry their file type, so only the diagram check stats
+    with os.scandir("data") as entries:
+        for entry in entries:
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "cluster_diagram.png")):
+                datasets.append(entry.name)
     
-    return datasets
+    return sorted(datasets)
 
 def view_diagram(dataset_name):
     """View cluster diagram and temporal loads for a specific dataset."""
@@ -38,12 +165,14 @@ def view_diagram(dataset_name):
     
     try:
         # Try to open with default image viewer
-        os.system(f"xdg-open '{diagram_path}' 2>/dev/null")
+        has_temporal = temporal_path.exists()
+        for path in [diagram_path, temporal_path] if has_temporal else [diagram_path]:
+            _xdg_open(path)
+        
         print(f"Opening cluster diagram for '{dataset_name}'")
         print(f"Diagram path: {diagram_path}")
         
-        if temporal_path.exists():
-            os.system(f"xdg-open '{temporal_path}' 2>/dev/null")
+        if has_temporal:
             print(f"Opening temporal loads plot: {temporal_path}")
         else:
             print(f"No temporal loads plot found (use enhanced generator for temporal analysis)")
@@ -65,20 +194,17 @@ def show_dataset_summary(dataset_name):
         print(f"No clusters_cap.csv found for dataset '{dataset_name}'")
         return
     
-    import pandas as pd
-    
-    df = pd.read_csv(clusters_cap_path)
+    df = read_csv(clusters_cap_path)
     
     print(f"\n📊 Dataset Summary: {dataset_name}")
     print("=" * 50)
     
-    total_cpu_cap = df['cpu_cap'].sum()
-    total_mem_cap = df['mem_cap'].sum() 
-    total_vf_cap = df['vf_cap'].sum()
-    
-    total_cpu_req = df['cpu_req'].sum()
-    total_mem_req = df['mem_req'].sum()
-    total_vf_req = df['vf_req'].sum()
+    # One pass over all six columns; each total keeps its column's dtype for printing
+    resources = ['cpu_cap', 'mem_cap', 'vf_cap', 'cpu_req', 'mem_req', 'vf_req']
+    values = df[resources].to_numpy(dtype=np.float64)
+    total_cpu_cap, total_mem_cap, total_vf_cap, total_cpu_req, total_mem_req, total_vf_req = (
+        df[col].dtype.type(total) for col, total in zip(resources, values.sum(axis=0))
+    )
     
     cpu_util = (total_cpu_req / total_cpu_cap * 100) if total_cpu_cap > 0 else 0
     mem_util = (total_mem_req / total_mem_cap * 100) if total_mem_cap > 0 else 0
@@ -89,38 +215,36 @@ def show_dataset_summary(dataset_name):
     print(f"  Memory: {total_mem_req}/{total_mem_cap} ({mem_util:.1f}%)")
     print(f"  VF: {total_vf_req}/{total_vf_cap} ({vf_util:.1f}%)")
     
+    # Per-cluster cpu/mem/vf percentages for every row at once
+    caps = values[:, :3]
+    reqs = values[:, 3:]
+    percentages = np.divide(reqs, caps, out=np.zeros_like(reqs), where=caps > 0) * 100
+    
     print(f"\nPer-Cluster Details:")
-    for _, row in df.iterrows():
-        cluster_id = row['id']
-        cpu_pct = (row['cpu_req'] / row['cpu_cap'] * 100) if row['cpu_cap'] > 0 else 0
-        mem_pct = (row['mem_req'] / row['mem_cap'] * 100) if row['mem_cap'] > 0 else 0
-        vf_pct = (row['vf_req'] / row['vf_cap'] * 100) if row['vf_cap'] > 0 else 0
+    for row, (cpu_pct, mem_pct, vf_pct) in zip(df.itertuples(index=False), percentages.tolist()):
+        cluster_id = row.id
         
         status = "HIGH LOAD" if (cpu_pct > 80 or mem_pct > 80) else "Normal"
-        mano = "✓" if row['mano_supported'] else "✗"
-        sriov = "✓" if row['sriov_supported'] else "✗"
+        mano = "✓" if row.mano_supported else "✗"
+        sriov = "✓" if row.sriov_supported else "✗"
         
         print(f"  Cluster {cluster_id}: CPU {cpu_pct:.1f}%, Mem {mem_pct:.1f}%, VF {vf_pct:.1f}% | MANO {mano} SR-IOV {sriov} [{status}]")
     
     # Temporal analysis if available
     if temporal_loads_path.exists():
-        temporal_df = pd.read_csv(temporal_loads_path)
+        # Per-cluster maxima and peak periods, streamed in chunks
+        maxes, peak_cpu_times, peak_mem_times = temporal_peaks(temporal_loads_path)
         print(f"\n⏰ Temporal Load Analysis:")
         
         for cluster_id in df['id']:
-            cluster_data = temporal_df[temporal_df['cluster_id'] == cluster_id]
-            if not cluster_data.empty:
-                max_cpu = cluster_data['cpu_load'].max()
-                max_mem = cluster_data['mem_load'].max()
-                max_jobs = cluster_data['job_count'].max()
-                
-                # Find peak periods
-                peak_cpu_times = cluster_data[cluster_data['cpu_load'] == max_cpu]['timeslice'].tolist()
-                peak_mem_times = cluster_data[cluster_data['mem_load'] == max_mem]['timeslice'].tolist()
+            if cluster_id in maxes.index:
+                max_cpu = maxes.at[cluster_id, 'cpu_load']
+                max_mem = maxes.at[cluster_id, 'mem_load']
+                max_jobs = maxes.at[cluster_id, 'job_count']
                 
                 print(f"  Cluster {cluster_id}:")
-                print(f"    Peak CPU: {max_cpu} at timeslice(s) {peak_cpu_times}")
-                print(f"    Peak Memory: {max_mem} at timeslice(s) {peak_mem_times}")
+                print(f"    Peak CPU: {max_cpu} at timeslice(s) {peak_cpu_times[cluster_id]}")
+                print(f"    Peak Memory: {max_mem} at timeslice(s) {peak_mem_times[cluster_id]}")
                 print(f"    Max concurrent jobs: {max_jobs}")
     else:
         print(f"\n⏰ No temporal analysis data found (use enhanced generator for temporal patterns)")
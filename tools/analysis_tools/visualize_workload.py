@@ -5,80 +5,110 @@ Dataset Workload Visualizer
 Creates visualizations showing workload distribution across clusters for M-DRA datasets.
 """
 
+import io
+import os
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Figures are only saved to disk - no GUI backend needed
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 
 
+# Columns read from each dataset CSV and their dtypes; the rest are skipped
+CSV_DTYPES = {
+    'jobs.csv': {'id': 'int32', 'default_cluster': 'int32',
+                 'cpu_req': 'float64', 'mem_req': 'float64', 'vf_req': 'int32'},
+    'nodes.csv': {'id': 'int32', 'default_cluster': 'int32',
+                  'cpu_cap': 'float64', 'mem_cap': 'float64', 'vf_cap': 'int32'},
+    'clusters.csv': {'id': 'int32', 'name': 'str'},
+}
+
+
+# Dashboard panels in their default order; --panels selects a subset
+PANELS = ('jobs', 'cpu', 'mem', 'vf', 'cpu_util', 'mem_util', 'nodes', 'cpu_dist', 'table')
+
+
+# Above this many clusters per-bar value labels overlap and are skipped
+MAX_BAR_LABELS = 30
+
+
+@lru_cache(maxsize=64)
+def _read_csv_cached(path_str, mtime):
+    """Parse a CSV once per (path, mtime); rewriting the file changes the key."""
+    dtypes = CSV_DTYPES.get(Path(path_str).name)
+    if dtypes is None:
+        return pd.read_csv(path_str)
+    return pd.read_csv(path_str, usecols=lambda col: col in dtypes, dtype=dtypes, engine='c')
+
+
+def read_csv(path):
+    """Read a dataset CSV, reusing the parse from an earlier call when unchanged."""
+    path = Path(path).resolve()
+    return _read_csv_cached(str(path), path.stat().st_mtime).copy(deep=False)
+
+
 def load_dataset(dataset_path):
     """Load jobs, nodes, and clusters data from a dataset directory."""
     dataset_path = Path(dataset_path)
     
-    jobs_df = pd.read_csv(dataset_path / "jobs.csv")
-    nodes_df = pd.read_csv(dataset_path / "nodes.csv")
-    clusters_df = pd.read_csv(dataset_path / "clusters.csv")
+    jobs_df = read_csv(dataset_path / "jobs.csv")
+    nodes_df = read_csv(dataset_path / "nodes.csv")
+    clusters_df = read_csv(dataset_path / "clusters.csv")
     
     return jobs_df, nodes_df, clusters_df
 
 
+def _sum_by_cluster(cluster_of, values, n, cluster_ids):
+    """Sum `values` per cluster id with bincount, gathered in `cluster_ids` order."""
+    sums = np.bincount(cluster_of, weights=values, minlength=n)[cluster_ids]
+    # bincount always returns float sums; keep integer columns integer
+    return sums.astype(values.dtype) if np.issubdtype(values.dtype, np.integer) else sums
+
+
 def calculate_cluster_workload(jobs_df, nodes_df, clusters_df):
     """Calculate workload by cluster."""
     
-    # Aggregate job requirements by cluster
-    job_workload = jobs_df.groupby('default_cluster').agg({
-        'cpu_req': 'sum',
-        'mem_req': 'sum', 
-        'vf_req': 'sum',
-        'id': 'count'  # Number of jobs
-    }).reset_index()
-    job_workload.rename(columns={'id': 'job_count'}, inplace=True)
-    
-    # Aggregate node capacity by cluster
-    node_capacity = nodes_df.groupby('default_cluster').agg({
-        'cpu_cap': 'sum',
-        'mem_cap': 'sum',
-        'vf_cap': 'sum',
-        'id': 'count'  # Number of nodes
-    }).reset_index()
-    node_capacity.rename(columns={'id': 'node_count'}, inplace=True)
-    
-    # Merge with cluster names
-    cluster_info = clusters_df[['id', 'name']].copy()
-    
-    # Combine all data
-    workload_data = cluster_info.merge(job_workload, left_on='id', right_on='default_cluster', how='left')
-    workload_data = workload_data.merge(node_capacity, left_on='id', right_on='default_cluster', how='left')
-    
-    # Fill NaN values with 0
-    workload_data = workload_data.fillna(0)
+    cluster_ids = clusters_df['id'].to_numpy()
+    job_clusters = jobs_df['default_cluster'].to_numpy()
+    node_clusters = nodes_df['default_cluster'].to_numpy()
+    
+    # One bincount slot per cluster id, including ids only referenced by jobs/nodes
+    n = int(max(cluster_ids.max(initial=0), job_clusters.max(initial=0), node_clusters.max(initial=0))) + 1
+    
+    # Job requirements and node capacity by cluster; clusters without jobs or nodes get 0
+    workload_data = pd.DataFrame({
+        'id': cluster_ids,
+        'name': clusters_df['name'].to_numpy(),
+        'cpu_req': _sum_by_cluster(job_clusters, jobs_df['cpu_req'].to_numpy(), n, cluster_ids),
+        'mem_req': _sum_by_cluster(job_clusters, jobs_df['mem_req'].to_numpy(), n, cluster_ids),
+        'vf_req': _sum_by_cluster(job_clusters, jobs_df['vf_req'].to_numpy(), n, cluster_ids),
+        'job_count': np.bincount(job_clusters, minlength=n)[cluster_ids],
+        'cpu_cap': _sum_by_cluster(node_clusters, nodes_df['cpu_cap'].to_numpy(), n, cluster_ids),
+        'mem_cap': _sum_by_cluster(node_clusters, nodes_df['mem_cap'].to_numpy(), n, cluster_ids),
+        'vf_cap': _sum_by_cluster(node_clusters, nodes_df['vf_cap'].to_numpy(), n, cluster_ids),
+        'node_count': np.bincount(node_clusters, minlength=n)[cluster_ids],
+    })
     
     # Calculate utilization percentages
-    workload_data['cpu_utilization'] = np.where(
-        workload_data['cpu_cap'] > 0,
-        (workload_data['cpu_req'] / workload_data['cpu_cap']) * 100,
-        0
-    )
-    
-    workload_data['mem_utilization'] = np.where(
-        workload_data['mem_cap'] > 0,
-        (workload_data['mem_req'] / workload_data['mem_cap']) * 100,
-        0
-    )
-    
-    workload_data['vf_utilization'] = np.where(
-        workload_data['vf_cap'] > 0,
-        (workload_data['vf_req'] / workload_data['vf_cap']) * 100,
-        0
-    )
+    for resource in ('cpu', 'mem', 'vf'):
+        req = workload_data[f'{resource}_req'].to_numpy()
+        cap = workload_data[f'{resource}_cap'].to_numpy()
+        workload_data[f'{resource}_utilization'] = np.divide(
+            req, cap, out=np.zeros(len(cap)), where=cap > 0
+        ) * 100
     
     return workload_data
 
 
-def create_workload_visualizations(workload_data, dataset_name, output_dir):
-    """Create comprehensive workload visualizations."""
+def create_workload_visualizations(workload_data, dataset_name, output_dir, panels=PANELS):
+    """Create comprehensive workload visualizations, drawing only the selected panels."""
     
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
@@ -87,185 +117,202 @@ def create_workload_visualizations(workload_data, dataset_name, output_dir):
     plt.style.use('default')
     sns.set_palette("husl")
     
-    # Create a large figure with multiple subplots
-    fig = plt.figure(figsize=(20, 16))
+    # Three panels per row, sized as in the full 3x3 dashboard
+    nrows = -(-len(panels) // 3)
+    ncols = min(len(panels), 3)
+    fig, axes = plt.subplots(nrows, ncols, figsize=(16 * ncols / 3, 4 * nrows), squeeze=False)
     fig.suptitle(f'Workload Analysis - {dataset_name}', fontsize=16, fontweight='bold')
     
-    # 1. Job Distribution by Cluster
-    ax1 = plt.subplot(3, 3, 1)
-    bars1 = ax1.bar(workload_data['name'], workload_data['job_count'], 
-                    color='lightblue', edgecolor='navy', linewidth=1)
-    ax1.set_title('Jobs per Cluster', fontweight='bold')
-    ax1.set_xlabel('Cluster')
-    ax1.set_ylabel('Number of Jobs')
-    ax1.tick_params(axis='x', rotation=45)
-    
-    # Add value labels on bars
-    for bar in bars1:
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height)}', ha='center', va='bottom')
-    
-    # 2. CPU Requirements vs Capacity
-    ax2 = plt.subplot(3, 3, 2)
-    x = np.arange(len(workload_data['name']))
+    # Columns used by the plots, extracted once
+    names = workload_data['name'].to_numpy()
+    job_count = workload_data['job_count'].to_numpy()
+    node_count = workload_data['node_count'].to_numpy()
+    cpu_req = workload_data['cpu_req'].to_numpy()
+    cpu_cap = workload_data['cpu_cap'].to_numpy()
+    mem_req_gb = workload_data['mem_req'].to_numpy() / 1024.0
+    mem_cap_gb = workload_data['mem_cap'].to_numpy() / 1024.0
+    vf_req = workload_data['vf_req'].to_numpy()
+    vf_cap = workload_data['vf_cap'].to_numpy()
+    util = workload_data[['cpu_utilization', 'mem_utilization']].to_numpy()
+    x = np.arange(len(names))
     width = 0.35
     
-    bars2a = ax2.bar(x - width/2, workload_data['cpu_req'], width, 
-                     label='CPU Required', color='coral', alpha=0.8)
-    bars2b = ax2.bar(x + width/2, workload_data['cpu_cap'], width,
-                     label='CPU Capacity', color='lightgreen', alpha=0.8)
-    
-    ax2.set_title('CPU: Requirements vs Capacity', fontweight='bold')
-    ax2.set_xlabel('Cluster')
-    ax2.set_ylabel('CPU Cores')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(workload_data['name'], rotation=45)
-    ax2.legend()
-    
-    # Add value labels
-    for bars in [bars2a, bars2b]:
-        for bar in bars:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}', ha='center', va='bottom', fontsize=8)
-    
-    # 3. Memory Requirements vs Capacity
-    ax3 = plt.subplot(3, 3, 3)
-    bars3a = ax3.bar(x - width/2, workload_data['mem_req']/1024, width, 
-                     label='Memory Required', color='orange', alpha=0.8)
-    bars3b = ax3.bar(x + width/2, workload_data['mem_cap']/1024, width,
-                     label='Memory Capacity', color='lightblue', alpha=0.8)
-    
-    ax3.set_title('Memory: Requirements vs Capacity', fontweight='bold')
-    ax3.set_xlabel('Cluster')
-    ax3.set_ylabel('Memory (GB)')
-    ax3.set_xticks(x)
-    ax3.set_xticklabels(workload_data['name'], rotation=45)
-    ax3.legend()
-    
-    # Add value labels
-    for bars in [bars3a, bars3b]:
-        for bar in bars:
-            height = bar.get_height()
-            ax3.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}', ha='center', va='bottom', fontsize=8)
-    
-    # 4. VF Requirements vs Capacity
-    ax4 = plt.subplot(3, 3, 4)
-    bars4a = ax4.bar(x - width/2, workload_data['vf_req'], width,
-                     label='VF Required', color='purple', alpha=0.8)
-    bars4b = ax4.bar(x + width/2, workload_data['vf_cap'], width,
-                     label='VF Capacity', color='yellow', alpha=0.8)
-    
-    ax4.set_title('Virtual Functions: Requirements vs Capacity', fontweight='bold')
-    ax4.set_xlabel('Cluster')
-    ax4.set_ylabel('VF Count')
-    ax4.set_xticks(x)
-    ax4.set_xticklabels(workload_data['name'], rotation=45)
-    ax4.legend()
-    
-    # Add value labels
-    for bars in [bars4a, bars4b]:
-        for bar in bars:
-            height = bar.get_height()
-            ax4.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{int(height)}', ha='center', va='bottom', fontsize=8)
-    
-    # 5. CPU Utilization Percentage
-    ax5 = plt.subplot(3, 3, 5)
-    colors = ['red' if x > 100 else 'orange' if x > 80 else 'green' for x in workload_data['cpu_utilization']]
-    bars5 = ax5.bar(workload_data['name'], workload_data['cpu_utilization'], 
-                    color=colors, alpha=0.7, edgecolor='black')
-    ax5.axhline(y=100, color='red', linestyle='--', alpha=0.7, label='100% Capacity')
-    ax5.set_title('CPU Utilization %', fontweight='bold')
-    ax5.set_xlabel('Cluster')
-    ax5.set_ylabel('Utilization %')
-    ax5.tick_params(axis='x', rotation=45)
-    ax5.legend()
-    
-    # Add percentage labels
-    for bar in bars5:
-        height = bar.get_height()
-        ax5.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.1f}%', ha='center', va='bottom')
-    
-    # 6. Memory Utilization Percentage
-    ax6 = plt.subplot(3, 3, 6)
-    colors = ['red' if x > 100 else 'orange' if x > 80 else 'green' for x in workload_data['mem_utilization']]
-    bars6 = ax6.bar(workload_data['name'], workload_data['mem_utilization'], 
-                    color=colors, alpha=0.7, edgecolor='black')
-    ax6.axhline(y=100, color='red', linestyle='--', alpha=0.7, label='100% Capacity')
-    ax6.set_title('Memory Utilization %', fontweight='bold')
-    ax6.set_xlabel('Cluster')
-    ax6.set_ylabel('Utilization %')
-    ax6.tick_params(axis='x', rotation=45)
-    ax6.legend()
-    
-    # Add percentage labels
-    for bar in bars6:
-        height = bar.get_height()
-        ax6.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.1f}%', ha='center', va='bottom')
-    
-    # 7. Node Distribution
-    ax7 = plt.subplot(3, 3, 7)
-    bars7 = ax7.bar(workload_data['name'], workload_data['node_count'], 
-                    color='lightcoral', edgecolor='darkred', linewidth=1)
-    ax7.set_title('Nodes per Cluster', fontweight='bold')
-    ax7.set_xlabel('Cluster')
-    ax7.set_ylabel('Number of Nodes')
-    ax7.tick_params(axis='x', rotation=45)
-    
-    # Add value labels
-    for bar in bars7:
-        height = bar.get_height()
-        ax7.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height)}', ha='center', va='bottom')
-    
-    # 8. Resource Summary Pie Chart (CPU)
-    ax8 = plt.subplot(3, 3, 8)
-    cpu_data = workload_data[workload_data['cpu_req'] > 0]
-    if len(cpu_data) > 0:
-        ax8.pie(cpu_data['cpu_req'], labels=cpu_data['name'], autopct='%1.1f%%',
-                startangle=90)
-        ax8.set_title('CPU Requirements Distribution', fontweight='bold')
-    
-    # 9. Summary Table
-    ax9 = plt.subplot(3, 3, 9)
-    ax9.axis('tight')
-    ax9.axis('off')
-    
-    # Create summary table
-    summary_data = []
-    for _, row in workload_data.iterrows():
-        summary_data.append([
-            row['name'],
-            f"{int(row['job_count'])}",
-            f"{int(row['node_count'])}",
-            f"{row['cpu_utilization']:.1f}%",
-            f"{row['mem_utilization']:.1f}%"
-        ])
-    
-    table = ax9.table(cellText=summary_data,
-                      colLabels=['Cluster', 'Jobs', 'Nodes', 'CPU %', 'Mem %'],
-                      cellLoc='center',
-                      loc='center')
-    table.auto_set_font_size(False)
-    table.set_fontsize(10)
-    table.scale(1.2, 1.5)
-    ax9.set_title('Summary Table', fontweight='bold')
+    # Per-bar value labels only while they stay readable
+    label_bars = len(names) <= MAX_BAR_LABELS
+    
+    # Bar colors for both utilization plots: red over capacity, orange above 80%
+    util_colors = np.select([util > 100, util > 80], ['red', 'orange'], default='green')
+    
+    def plot_jobs(ax):
+        # Job Distribution by Cluster
+        bars1 = ax.bar(names, job_count, 
+                       color='lightblue', edgecolor='navy', linewidth=1)
+        ax.set_title('Jobs per Cluster', fontweight='bold')
+        ax.set_xlabel('Cluster')
+        ax.set_ylabel('Number of Jobs')
+        ax.tick_params(axis='x', rotation=45)
+        
+        # Add value labels on bars
+        if label_bars:
+            ax.bar_label(bars1, fmt='%d')
+    
+    def plot_cpu(ax):
+        # CPU Requirements vs Capacity
+        bars2a = ax.bar(x - width/2, cpu_req, width, 
+                        label='CPU Required', color='coral', alpha=0.8)
+        bars2b = ax.bar(x + width/2, cpu_cap, width,
+                        label='CPU Capacity', color='lightgreen', alpha=0.8)
+        
+        ax.set_title('CPU: Requirements vs Capacity', fontweight='bold')
+        ax.set_xlabel('Cluster')
+        ax.set_ylabel('CPU Cores')
+        ax.set_xticks(x)
+        ax.set_xticklabels(names, rotation=45)
+        ax.legend()
+        
+        # Add value labels
+        if label_bars:
+            for bars in [bars2a, bars2b]:
+                ax.bar_label(bars, fmt='%.1f', fontsize=8)
+    
+    def plot_mem(ax):
+        # Memory Requirements vs Capacity
+        bars3a = ax.bar(x - width/2, mem_req_gb, width, 
+                        label='Memory Required', color='orange', alpha=0.8)
+        bars3b = ax.bar(x + width/2, mem_cap_gb, width,
+                        label='Memory Capacity', color='lightblue', alpha=0.8)
+        
+        ax.set_title('Memory: Requirements vs Capacity', fontweight='bold')
+        ax.set_xlabel('Cluster')
+        ax.set_ylabel('Memory (GB)')
+        ax.set_xticks(x)
+        ax.set_xticklabels(names, rotation=45)
+        ax.legend()
+        
+        # Add value labels
+        if label_bars:
+            for bars in [bars3a, bars3b]:
+                ax.bar_label(bars, fmt='%.1f', fontsize=8)
+    
+    def plot_vf(ax):
+        # VF Requirements vs Capacity
+        bars4a = ax.bar(x - width/2, vf_req, width,
+                        label='VF Required', color='purple', alpha=0.8)
+        bars4b = ax.bar(x + width/2, vf_cap, width,
+                        label='VF Capacity', color='yellow', alpha=0.8)
+        
+        ax.set_title('Virtual Functions: Requirements vs Capacity', fontweight='bold')
+        ax.set_xlabel('Cluster')
+        ax.set_ylabel('VF Count')
+        ax.set_xticks(x)
+        ax.set_xticklabels(names, rotation=45)
+        ax.legend()
+        
+        # Add value labels
+        if label_bars:
+            for bars in [bars4a, bars4b]:
+                ax.bar_label(bars, fmt='%d', fontsize=8)
+    
+    def plot_cpu_util(ax):
+        # CPU Utilization Percentage
+        bars5 = ax.bar(names, util[:, 0], 
+                       color=util_colors[:, 0], alpha=0.7, edgecolor='black')
+        ax.axhline(y=100, color='red', linestyle='--', alpha=0.7, label='100% Capacity')
+        ax.set_title('CPU Utilization %', fontweight='bold')
+        ax.set_xlabel('Cluster')
+        ax.set_ylabel('Utilization %')
+        ax.tick_params(axis='x', rotation=45)
+        ax.legend()
+        
+        # Add percentage labels
+        if label_bars:
+            ax.bar_label(bars5, fmt='%.1f%%')
+    
+    def plot_mem_util(ax):
+        # Memory Utilization Percentage
+        bars6 = ax.bar(names, util[:, 1], 
+                       color=util_colors[:, 1], alpha=0.7, edgecolor='black')
+        ax.axhline(y=100, color='red', linestyle='--', alpha=0.7, label='100% Capacity')
+        ax.set_title('Memory Utilization %', fontweight='bold')
+        ax.set_xlabel('Cluster')
+        ax.set_ylabel('Utilization %')
+        ax.tick_params(axis='x', rotation=45)
+        ax.legend()
+        
+        # Add percentage labels
+        if label_bars:
+            ax.bar_label(bars6, fmt='%.1f%%')
+    
+    def plot_nodes(ax):
+        # Node Distribution
+        bars7 = ax.bar(names, node_count, 
+                       color='lightcoral', edgecolor='darkred', linewidth=1)
+        ax.set_title('Nodes per Cluster', fontweight='bold')
+        ax.set_xlabel('Cluster')
+        ax.set_ylabel('Number of Nodes')
+        ax.tick_params(axis='x', rotation=45)
+        
+        # Add value labels
+        if label_bars:
+            ax.bar_label(bars7, fmt='%d')
+    
+    def plot_cpu_dist(ax):
+        # CPU share per cluster; bars lay out linearly where pie labels collide
+        total_cpu = cpu_req.sum()
+        if total_cpu > 0:
+            bars8 = ax.barh(names, cpu_req / total_cpu * 100, color='coral', alpha=0.8)
+            ax.invert_yaxis()
+            ax.set_xlabel('% of total CPU req')
+            ax.set_title('CPU Requirements Distribution', fontweight='bold')
+            
+            # Add percentage labels, with room past the longest bar
+            if label_bars:
+                ax.bar_label(bars8, fmt='%.1f%%')
+                ax.margins(x=0.15)
+    
+    def plot_table(ax):
+        # Summary Table
+        ax.axis('tight')
+        ax.axis('off')
+        
+        # Create summary table
+        summary_data = [
+            [str(name), f"{int(jobs)}", f"{int(nodes)}", f"{cpu_util:.1f}%", f"{mem_util:.1f}%"]
+            for name, jobs, nodes, (cpu_util, mem_util) in zip(names, job_count, node_count, util)
+        ]
+        
+        table = ax.table(cellText=summary_data,
+                         colLabels=['Cluster', 'Jobs', 'Nodes', 'CPU %', 'Mem %'],
+                          cellLoc='center',
+                          loc='center')
+        table.auto_set_font_size(False)
+        table.set_fontsize(10)
+        table.scale(1.2, 1.5)
+        table.set_rasterized(True)
+        ax.set_title('Summary Table', fontweight='bold')
+    
+    plotters = {
+        'jobs': plot_jobs, 'cpu': plot_cpu, 'mem': plot_mem, 'vf': plot_vf,
+        'cpu_util': plot_cpu_util, 'mem_util': plot_mem_util, 'nodes': plot_nodes,
+        'cpu_dist': plot_cpu_dist, 'table': plot_table,
+    }
+    for ax, panel in zip(axes.flat, panels):
+        plotters[panel](ax)
+    
+    # Hide the unused slots of the last row
+    for ax in axes.flat[len(panels):]:
+        ax.axis('off')
     
     # Adjust layout and save
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Save the plot
     output_file = output_path / f"{dataset_name}_workload_analysis.png"
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    # Layout is already tight, so skip bbox_inches='tight' and its extra render pass
+    fig.savefig(output_file, dpi=150)
     print(f"📊 Workload visualization saved: {output_file}")
     
-    # Show the plot
-    plt.show()
+    plt.close(fig)
     
     return workload_data
 
@@ -305,50 +352,81 @@ def print_workload_summary(workload_data, dataset_name):
     print(f"   VF Utilization: {(total_vf_req/total_vf_cap*100 if total_vf_cap > 0 else 0):.1f}%")
     
     print(f"\n🏗️  CLUSTER BREAKDOWN:")
-    for _, row in workload_data.iterrows():
-        print(f"   {row['name']}:")
-        print(f"      Jobs: {int(row['job_count'])}, Nodes: {int(row['node_count'])}")
-        print(f"      CPU: {row['cpu_req']:.1f}/{row['cpu_cap']:.1f} cores ({row['cpu_utilization']:.1f}%)")
-        print(f"      Memory: {row['mem_req']:,.0f}/{row['mem_cap']:,.0f} Mi ({row['mem_utilization']:.1f}%)")
-        print(f"      VF: {int(row['vf_req'])}/{int(row['vf_cap'])} ({row['vf_utilization']:.1f}%)")
+    for row in workload_data.itertuples(index=False):
+        print(f"   {row.name}:")
+        print(f"      Jobs: {int(row.job_count)}, Nodes: {int(row.node_count)}")
+        print(f"      CPU: {row.cpu_req:.1f}/{row.cpu_cap:.1f} cores ({row.cpu_utilization:.1f}%)")
+        print(f"      Memory: {row.mem_req:,.0f}/{row.mem_cap:,.0f} Mi ({row.mem_utilization:.1f}%)")
+        print(f"      VF: {int(row.vf_req)}/{int(row.vf_cap)} ({row.vf_utilization:.1f}%)")
         print()
 
 
+def analyze_dataset(dataset_path, output_dir, panels=PANELS):
+    """Load, aggregate, plot and summarize one dataset."""
+    dataset_path = Path(dataset_path)
+    dataset_name = dataset_path.name
+    
+    print(f"\n📁 Analyzing dataset: {dataset_name}")
+    print(f"   Path: {dataset_path}")
+    
+    try:
+        # Load dataset
+        jobs_df, nodes_df, clusters_df = load_dataset(dataset_path)
+        
+        # Calculate workload
+        workload_data = calculate_cluster_workload(jobs_df, nodes_df, clusters_df)
+        
+        # Create visualizations
+        create_workload_visualizations(workload_data, dataset_name, output_dir, panels)
+        
+        # Print summary
+        print_workload_summary(workload_data, dataset_name)
+        
+    except Exception as e:
+        print(f"❌ Error analyzing dataset {dataset_name}: {e}")
+
+
+def _analyze_dataset_captured(dataset_path, output_dir, panels):
+    """Run analyze_dataset in a pool worker and return what it printed."""
+    log = io.StringIO()
+    with redirect_stdout(log):
+        analyze_dataset(dataset_path, output_dir, panels)
+    return log.getvalue()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Visualize workload distribution across clusters")
     parser.add_argument("datasets", nargs='+', help="Dataset directory paths")
     parser.add_argument("--output", "-o", default="workload_analysis", help="Output directory for visualizations")
+    parser.add_argument("--panels", default="all",
+                        help=f"Comma-separated panels to draw ({','.join(PANELS)}) or 'all'")
     
     args = parser.parse_args()
     
+    if args.panels == 'all':
+        panels = PANELS
+    else:
+        panels = tuple(panel.strip() for panel in args.panels.split(',') if panel.strip())
+        unknown = [panel for panel in panels if panel not in PANELS]
+        if unknown or not panels:
+            parser.error(f"unknown panels: {', '.join(unknown)} (choose from {', '.join(PANELS)})")
+    
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
     
     print("🔍 M-DRA Dataset Workload Analyzer")
     print("="*50)
     
-    for dataset_path in args.datasets:
-        dataset_path = Path(dataset_path)
-        dataset_name = dataset_path.name
-        
-        print(f"\n📁 Analyzing dataset: {dataset_name}")
-        print(f"   Path: {dataset_path}")
-        
-        try:
-            # Load dataset
-            jobs_df, nodes_df, clusters_df = load_dataset(dataset_path)
-            
-            # Calculate workload
-            workload_data = calculate_cluster_workload(jobs_df, nodes_df, clusters_df)
-            
-            # Create visualizations
-            create_workload_visualizations(workload_data, dataset_name, output_dir)
-            
-            # Print summary
-            print_workload_summary(workload_data, dataset_name)
-            
-        except Exception as e:
-            print(f"❌ Error analyzing dataset {dataset_name}: {e}")
+    if len(args.datasets) > 1:
+        # Datasets are independent - analyze them in parallel and print each
+        # one's output in the order given
+        workers = min(len(args.datasets), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for log in executor.map(_analyze_dataset_captured, args.datasets,
+                                   repeat(output_dir), repeat(panels)):
+                print(log, end='')
+    else:
+        analyze_dataset(args.datasets[0], output_dir, panels)
     
     print(f"\n🎉 Analysis completed!")
     print(f"📁 Visualizations saved in: {output_dir}")
@@ -7,20 +7,71 @@ Shows how resource requirements change throughout the scheduling period.
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Figures are only saved to disk - no GUI backend needed
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 import argparse
 from pathlib import Path
 
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+# Plotting style, set once for every figure; the rcParams must follow the style
+# reset. Long time-series paths are simplified and drawn in chunks.
+plt.style.use('default')
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+
+# Columns read from each dataset CSV; None leaves the dtype to inference, as
+# requirements and capacities are integers in some datasets and floats in others
+CSV_COLUMNS = {
+    'jobs.csv': {'default_cluster': 'int32', 'start_time': 'int32', 'duration': 'int32',
+                 'cpu_req': None, 'mem_req': None, 'vf_req': 'int32'},
+    'nodes.csv': {'default_cluster': 'int32', 'cpu_cap': None, 'mem_cap': None, 'vf_cap': 'int32'},
+    'clusters.csv': {'id': 'int32', 'name': 'str'},
+}
+
+# Line plots longer than this are downsampled to LTTB_POINTS before drawing
+MAX_LINE_POINTS = 5000
+LTTB_POINTS = 2000
+
+
+def read_csv(path):
+    """Read the columns of a dataset CSV used here, with fixed dtypes where known."""
+    columns = CSV_COLUMNS[path.name]
+    dtypes = {col: dtype for col, dtype in columns.items() if dtype}
+    if pa is not None:
+        # The pyarrow engine parses columns on several threads but takes no
+        # callable usecols, so pick the wanted columns from the header
+        usecols = [col for col in pd.read_csv(path, nrows=0).columns if col in columns]
+        return pd.read_csv(path, engine='pyarrow', usecols=usecols,
+                           dtype={col: dtypes[col] for col in usecols if col in dtypes})
+    return pd.read_csv(path, usecols=lambda col: col in columns, dtype=dtypes)
+
 
 def load_dataset(dataset_path):
     """Load jobs, nodes, and clusters data from a dataset directory."""
     dataset_path = Path(dataset_path)
     
-    jobs_df = pd.read_csv(dataset_path / "jobs.csv")
-    nodes_df = pd.read_csv(dataset_path / "nodes.csv")
-    clusters_df = pd.read_csv(dataset_path / "clusters.csv")
+    jobs_df = read_csv(dataset_path / "jobs.csv")
+    nodes_df = read_csv(dataset_path / "nodes.csv")
+    clusters_df = read_csv(dataset_path / "clusters.csv")
+    
+    # Cluster references as categoricals over the cluster ids, so their codes are
+    # the dense cluster index (-1 for a cluster missing from clusters.csv)
+    for df in (jobs_df, nodes_df):
+        df['default_cluster'] = pd.Categorical(df['default_cluster'], categories=clusters_df['id'])
     
     return jobs_df, nodes_df, clusters_df
 
@@ -29,70 +80,155 @@ def calculate_workload_over_time(jobs_df, nodes_df, clusters_df, timeslice_durat
     """Calculate resource requirements for each cluster over time."""
     
     # Find the maximum time span
-    max_end_time = (jobs_df['start_time'] + jobs_df['duration']).max()
-    timeslices = list(range(0, int(max_end_time) + 1))
-    
-    # Get cluster capacities
-    cluster_capacities = {}
-    for _, cluster in clusters_df.iterrows():
-        cluster_nodes = nodes_df[nodes_df['default_cluster'] == cluster['id']]
-        cluster_capacities[cluster['id']] = {
-            'name': cluster['name'],
-            'cpu_cap': cluster_nodes['cpu_cap'].sum(),
-            'mem_cap': cluster_nodes['mem_cap'].sum(),
-            'vf_cap': cluster_nodes['vf_cap'].sum()
-        }
-    
-    # Initialize workload tracking
-    workload_data = []
-    
-    for t in timeslices:
-        for cluster_id, cluster_info in cluster_capacities.items():
-            # Find jobs running at this timeslice in this cluster
-            running_jobs = jobs_df[
-                (jobs_df['default_cluster'] == cluster_id) &
-                (jobs_df['start_time'] <= t) &
-                (jobs_df['start_time'] + jobs_df['duration'] > t)
-            ]
-            
-            # Calculate total resource requirements
-            cpu_req = running_jobs['cpu_req'].sum()
-            mem_req = running_jobs['mem_req'].sum()
-            vf_req = running_jobs['vf_req'].sum()
-            job_count = len(running_jobs)
-            
-            workload_data.append({
-                'timeslice': t,
-                'cluster_id': cluster_id,
-                'cluster_name': cluster_info['name'],
-                'cpu_cap': cluster_info['cpu_cap'],
-                'mem_cap': cluster_info['mem_cap'],
-                'vf_cap': cluster_info['vf_cap'],
-                'cpu_req': cpu_req,
-                'mem_req': mem_req,
-                'vf_req': vf_req,
-                'job_count': job_count,
-                'cpu_utilization': (cpu_req / cluster_info['cpu_cap'] * 100) if cluster_info['cpu_cap'] > 0 else 0,
-                'mem_utilization': (mem_req / cluster_info['mem_cap'] * 100) if cluster_info['mem_cap'] > 0 else 0,
-                'vf_utilization': (vf_req / cluster_info['vf_cap'] * 100) if cluster_info['vf_cap'] > 0 else 0,
-                'time_minutes': t * timeslice_duration / 60  # Convert to minutes
-            })
-    
-    return pd.DataFrame(workload_data)
+    starts = jobs_df['start_time'].to_numpy()
+    ends = starts + jobs_df['duration'].to_numpy()
+    max_end_time = ends.max()
+    timeslices = np.arange(int(max_end_time) + 1)
+    
+    # Get cluster capacities, indexed by cluster id; clusters without nodes get 0
+    capacities = nodes_df.groupby('default_cluster', sort=False, observed=True)[['cpu_cap', 'mem_cap', 'vf_cap']].sum()
+    cluster_capacities = clusters_df.set_index('id')[['name']].join(
+        capacities.reindex(clusters_df['id'], fill_value=0)
+    )
+    
+    # Dense cluster index per job; jobs whose cluster is not in clusters_df are dropped
+    job_clusters = jobs_df['default_cluster']
+    if (isinstance(job_clusters.dtype, pd.CategoricalDtype)
+            and job_clusters.cat.categories.equals(cluster_capacities.index)):
+        # Codes are as narrow as int8; widen before they are used to compute bins
+        position = job_clusters.cat.codes.to_numpy().astype(np.intp)
+    else:
+        position = cluster_capacities.index.get_indexer(job_clusters)
+    known = position >= 0
+    cluster_index = position[known]
+    
+    # Flat (cluster, timeslice) bins of a job's start and end in the delta array
+    width = len(timeslices) + 1
+    delta_bins = np.concatenate((cluster_index * width + starts[known],
+                                 cluster_index * width + ends[known]))
+    
+    def sum_by_cluster(values):
+        """Sum values of the running jobs per cluster and timeslice."""
+        # Sweep line: +value when a job starts, -value when it ends, then a running sum
+        values = values[known]
+        delta = np.bincount(delta_bins, weights=np.concatenate((values, -values)),
+                            minlength=len(cluster_capacities) * width)
+        # bincount always returns float sums; keep integer columns integer
+        if np.issubdtype(values.dtype, np.integer):
+            delta = delta.astype(values.dtype)
+        return delta.reshape(-1, width).cumsum(axis=1)[:, :-1]
+    
+    def sum_running(values):
+        """sum_by_cluster, exactly 0 wherever no job is running."""
+        # Float starts and ends need not cancel exactly in the running sum
+        sums = sum_by_cluster(values)
+        sums[jobs_by_cluster == 0] = 0
+        return sums
+    
+    jobs_by_cluster = sum_by_cluster(np.ones(len(jobs_df), dtype=np.int64))
+    cpu_by_cluster = sum_running(jobs_df['cpu_req'].to_numpy())
+    mem_by_cluster = sum_running(jobs_df['mem_req'].to_numpy())
+    vf_by_cluster = sum_running(jobs_df['vf_req'].to_numpy())
+    
+    # One row per (timeslice, cluster), ordered by timeslice then cluster
+    n_timeslices = len(timeslices)
+    timeslice = np.repeat(timeslices, len(cluster_capacities))
+    
+    def per_row(values):
+        """Repeat a per-cluster array once for every timeslice."""
+        return np.tile(values, n_timeslices)
+    
+    cpu_cap = per_row(cluster_capacities['cpu_cap'].to_numpy())
+    mem_cap = per_row(cluster_capacities['mem_cap'].to_numpy())
+    vf_cap = per_row(cluster_capacities['vf_cap'].to_numpy())
+    cpu_req = cpu_by_cluster.T.ravel()
+    mem_req = mem_by_cluster.T.ravel()
+    vf_req = vf_by_cluster.T.ravel()
+    
+    def utilization(req, cap):
+        """Requirement as a percentage of capacity, 0 where there is no capacity."""
+        if ne is not None:
+            # One fused, multi-threaded pass without intermediate arrays
+            return ne.evaluate('where(cap > 0, req / cap * 100.0, 0.0)',
+                               local_dict={'req': req, 'cap': cap})
+        return np.divide(req, cap, out=np.zeros(len(cap)), where=cap > 0) * 100
+    
+    # Counters fit in 32 bits; float columns stay float64 so saved values and
+    # printed percentages are unchanged
+    return pd.DataFrame({
+        'timeslice': timeslice,
+        'cluster_id': per_row(cluster_capacities.index.to_numpy()),
+        'cluster_name': per_row(cluster_capacities['name'].to_numpy()),
+        'cpu_cap': cpu_cap,
+        'mem_cap': mem_cap,
+        'vf_cap': vf_cap,
+        'cpu_req': cpu_req,
+        'mem_req': mem_req,
+        'vf_req': vf_req,
+        'job_count': jobs_by_cluster.T.ravel(),
+        'cpu_utilization': utilization(cpu_req, cpu_cap),
+        'mem_utilization': utilization(mem_req, mem_cap),
+        'vf_utilization': utilization(vf_req, vf_cap),
+        'time_minutes': timeslice * timeslice_duration / 60  # Convert to minutes
+    }).astype({'timeslice': 'int32', 'cluster_id': 'int32', 'job_count': 'int32'})
+
+
+def downsample_lttb(x, y, n_out=LTTB_POINTS):
+    """Pick n_out points of a series with Largest-Triangle-Three-Buckets, keeping its shape."""
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+    xf = np.asarray(x, dtype=float)
+    yf = np.asarray(y, dtype=float)
+    
+    # First and last points are kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    
+    prev = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        # Third vertex: mean of the next bucket, or the last point
+        if b + 2 < len(edges):
+            next_x = xf[hi:edges[b + 2]].mean()
+            next_y = yf[hi:edges[b + 2]].mean()
+        else:
+            next_x, next_y = xf[-1], yf[-1]
+        area = np.abs((xf[prev] - next_x) * (yf[lo:hi] - yf[prev])
+                      - (xf[prev] - xf[lo:hi]) * (next_y - yf[prev]))
+        prev = lo + int(np.argmax(area))
+        keep[b + 1] = prev
+    
+    return np.asarray(x)[keep], np.asarray(y)[keep]
+
+
+def plot_series(ax, x, y, **kwargs):
+    """ax.plot for a time series, rasterized and downsampled when very long."""
+    if len(x) > MAX_LINE_POINTS:
+        x, y = downsample_lttb(x, y)
+    return ax.plot(x, y, rasterized=True, **kwargs)
 
 
-def create_time_based_visualizations(workload_df, dataset_name, output_dir, timeslice_duration=15):
+def group_by_cluster(workload_df):
+    """Each cluster's rows ordered by timeslice, keyed by cluster name in sorted order."""
+    groups = {
+        cluster: cluster_data.sort_values('timeslice')
+        for cluster, cluster_data in workload_df.groupby('cluster_name', sort=False)
+    }
+    return {cluster: groups[cluster] for cluster in sorted(groups)}
+
+
+def create_time_based_visualizations(workload_df, dataset_name, output_dir, timeslice_duration=15,
+                                     output_format='parquet'):
     """Create time-based workload visualizations in the style of solver results."""
     
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    # Set up plotting style
-    plt.style.use('default')
-    
-    # Get unique clusters
-    clusters = sorted(workload_df['cluster_name'].unique())
-    n_clusters = len(clusters)
+    # Split by cluster once; the summary plots reuse the same groups
+    cluster_frames = group_by_cluster(workload_df)
+    n_clusters = len(cluster_frames)
     
     # Create figure with subplots - one row per cluster, 3 columns (CPU, Memory, VF)
     fig, axes = plt.subplots(n_clusters, 3, figsize=(20, 5*n_clusters))
@@ -116,13 +252,7 @@ def create_time_based_visualizations(workload_df, dataset_name, output_dir, time
         axes[0, 2].text(0.5, 1.15, 'VIRTUAL FUNCTIONS', transform=axes[0, 2].transAxes, 
                        ha='center', va='bottom', fontsize=14, fontweight='bold')
     
-    for i, cluster in enumerate(clusters):
-        cluster_data = workload_df[workload_df['cluster_name'] == cluster].copy()
-        cluster_data = cluster_data.sort_values('timeslice')
-        
-        if len(cluster_data) == 0:
-            continue
-            
+    for i, (cluster, cluster_data) in enumerate(cluster_frames.items()):
         timeslices = cluster_data['timeslice'].values
         
         # Get cluster capacities
@@ -130,9 +260,23 @@ def create_time_based_visualizations(workload_df, dataset_name, output_dir, time
         mem_cap = cluster_data['mem_cap'].iloc[0] 
         vf_cap = cluster_data['vf_cap'].iloc[0]
         
+        # Columns used by the three plots, extracted once
+        cpu_req = cluster_data['cpu_req'].to_numpy()
+        mem_req = cluster_data['mem_req'].to_numpy()
+        vf_req = cluster_data['vf_req'].to_numpy()
+        cpu_util = cluster_data['cpu_utilization'].to_numpy()
+        mem_util = cluster_data['mem_utilization'].to_numpy()
+        vf_util = cluster_data['vf_utilization'].to_numpy()
+        vf_used = vf_req.max() > 0
+        
         # Calculate total utilization (CPU + Memory combined)
-        total_utilization = (cluster_data['cpu_utilization'] + cluster_data['mem_utilization']) / 2
+        total_utilization = (cpu_util + mem_util) / 2
         high_load_mask = total_utilization > 70
+        has_high_load = high_load_mask.any()
+        high_load_timeslices = timeslices[high_load_mask]
+        
+        # Critical (>90%) points of all three resources in one comparison
+        critical_cpu_mask, critical_mem_mask, critical_vf_mask = np.stack((cpu_util, mem_util, vf_util)) > 90
         
         # CPU Plot
         ax_cpu = axes[i, 0]
@@ -142,23 +286,21 @@ def create_time_based_visualizations(workload_df, dataset_name, output_dir, time
                        label=f'Max Capacity ({cpu_cap:.1f})', alpha=0.8)
         
         # Plot requirements
-        ax_cpu.plot(timeslices, cluster_data['cpu_req'], color=requirement_color, 
-                   linewidth=1.5, label='Usage (Used)', alpha=0.8)
+        plot_series(ax_cpu, timeslices, cpu_req, color=requirement_color,
+                    linewidth=1.5, label='Usage (Used)', alpha=0.8)
         
         # Highlight high load periods
-        if high_load_mask.any():
-            high_load_timeslices = timeslices[high_load_mask]
-            high_load_cpu = cluster_data['cpu_req'].values[high_load_mask]
+        if has_high_load:
+            high_load_cpu = cpu_req[high_load_mask]
             ax_cpu.scatter(high_load_timeslices, high_load_cpu, color=high_load_color, 
-                          s=30, label='High Load (>70%)', alpha=0.8, zorder=5)
+                          s=30, label='High Load (>70%)', alpha=0.8, zorder=5, rasterized=True)
         
         # Mark critical CPU utilization (>90%) - small dots only
-        critical_cpu_mask = cluster_data['cpu_utilization'] > 90
         if critical_cpu_mask.any():
             critical_cpu_times = timeslices[critical_cpu_mask]
-            critical_cpu_values = cluster_data['cpu_req'].values[critical_cpu_mask]
+            critical_cpu_values = cpu_req[critical_cpu_mask]
             ax_cpu.scatter(critical_cpu_times, critical_cpu_values, color='red', marker='o',
-                          s=15, label='Critical (>90%)', alpha=0.7, zorder=10)
+                          s=15, label='Critical (>90%)', alpha=0.7, zorder=10, rasterized=True)
         
         ax_cpu.set_title(f'{cluster} - CPU Usage', fontweight='bold', fontsize=12)
         ax_cpu.set_xlabel('Timeslice', fontsize=10)
@@ -175,23 +317,21 @@ def create_time_based_visualizations(workload_df, dataset_name, output_dir, time
                        label=f'Max Capacity ({mem_cap:,.0f})', alpha=0.8)
         
         # Plot requirements
-        ax_mem.plot(timeslices, cluster_data['mem_req'], color=requirement_color,
-                   linewidth=1.5, label='Usage (Used)', alpha=0.8)
+        plot_series(ax_mem, timeslices, mem_req, color=requirement_color,
+                    linewidth=1.5, label='Usage (Used)', alpha=0.8)
         
         # Highlight high load periods
-        if high_load_mask.any():
-            high_load_timeslices = timeslices[high_load_mask]
-            high_load_mem = cluster_data['mem_req'].values[high_load_mask]
+        if has_high_load:
+            high_load_mem = mem_req[high_load_mask]
             ax_mem.scatter(high_load_timeslices, high_load_mem, color=high_load_color,
-                          s=30, label='High Load (>70%)', alpha=0.8, zorder=5)
+                          s=30, label='High Load (>70%)', alpha=0.8, zorder=5, rasterized=True)
         
         # Mark critical Memory utilization (>90%) - small dots only
-        critical_mem_mask = cluster_data['mem_utilization'] > 90
         if critical_mem_mask.any():
             critical_mem_times = timeslices[critical_mem_mask]
-            critical_mem_values = cluster_data['mem_req'].values[critical_mem_mask]
+            critical_mem_values = mem_req[critical_mem_mask]
             ax_mem.scatter(critical_mem_times, critical_mem_values, color='red', marker='o',
-                          s=15, label='Critical (>90%)', alpha=0.7, zorder=10)
+                          s=15, label='Critical (>90%)', alpha=0.7, zorder=10, rasterized=True)
         
         ax_mem.set_title(f'{cluster} - Memory Usage', fontweight='bold', fontsize=12)
         ax_mem.set_xlabel('Timeslice', fontsize=10)
@@ -209,23 +349,21 @@ def create_time_based_visualizations(workload_df, dataset_name, output_dir, time
                          label=f'Max Capacity ({vf_cap})', alpha=0.8)
         
         # Plot requirements
-        ax_vf.plot(timeslices, cluster_data['vf_req'], color=requirement_color,
-                  linewidth=1.5, label='Usage (Used)', alpha=0.8)
+        plot_series(ax_vf, timeslices, vf_req, color=requirement_color,
+                    linewidth=1.5, label='Usage (Used)', alpha=0.8)
         
         # Highlight high load periods (only if VF is used)
-        if high_load_mask.any() and cluster_data['vf_req'].max() > 0:
-            high_load_timeslices = timeslices[high_load_mask]
-            high_load_vf = cluster_data['vf_req'].values[high_load_mask]
+        if has_high_load and vf_used:
+            high_load_vf = vf_req[high_load_mask]
             ax_vf.scatter(high_load_timeslices, high_load_vf, color=high_load_color,
-                         s=30, label='High Load (>70%)', alpha=0.8, zorder=5)
+                         s=30, label='High Load (>70%)', alpha=0.8, zorder=5, rasterized=True)
         
         # Mark critical VF utilization (>90%) - small dots only
-        critical_vf_mask = cluster_data['vf_utilization'] > 90
-        if critical_vf_mask.any() and cluster_data['vf_req'].max() > 0:
+        if critical_vf_mask.any() and vf_used:
             critical_vf_times = timeslices[critical_vf_mask]
-            critical_vf_values = cluster_data['vf_req'].values[critical_vf_mask]
+            critical_vf_values = vf_req[critical_vf_mask]
             ax_vf.scatter(critical_vf_times, critical_vf_values, color='red', marker='o',
-                         s=15, label='Critical (>90%)', alpha=0.7, zorder=10)
+                         s=15, label='Critical (>90%)', alpha=0.7, zorder=10, rasterized=True)
         
         ax_vf.set_title(f'{cluster} - Virtual Functions', fontweight='bold', fontsize=12)
         ax_vf.set_xlabel('Timeslice', fontsize=10)
@@ -235,33 +373,45 @@ def create_time_based_visualizations(workload_df, dataset_name, output_dir, time
         ax_vf.set_ylim(bottom=0)
         
         # If no VF capacity, adjust y-axis
-        if vf_cap == 0 and cluster_data['vf_req'].max() == 0:
+        if vf_cap == 0 and not vf_used:
             ax_vf.set_ylim(0, 1)
     
     # Adjust layout and save
-    plt.tight_layout(rect=[0, 0, 1, 0.95])  # Leave space for suptitle and column headers
+    fig.tight_layout(rect=[0, 0, 1, 0.95])  # Leave space for suptitle and column headers
     
     # Save the plot
     output_file = output_path / f"{dataset_name}_workload_over_time.png"
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    fig.savefig(output_file, dpi=300, bbox_inches='tight')
     print(f"📊 Time-based workload visualization saved: {output_file}")
+    plt.close(fig)  # Close the figure to free memory
     
     # Create a separate summary plot showing utilization percentages
-    create_utilization_summary_plot(workload_df, dataset_name, output_path)
-    
-    # Save the workload data as CSV for analysis
-    csv_file = output_path / f"{dataset_name}_workload_over_time.csv"
-    workload_df.to_csv(csv_file, index=False)
-    print(f"📄 Workload data saved: {csv_file}")
+    create_utilization_summary_plot(workload_df, dataset_name, output_path, cluster_frames)
+    
+    # Save the workload data for analysis; Parquet dictionary-encodes the repeated cluster names
+    data_file = None
+    if output_format == 'parquet':
+        data_file = output_path / f"{dataset_name}_workload_over_time.parquet"
+        try:
+            workload_df.astype({'cluster_name': 'category'}).to_parquet(
+                data_file, compression='zstd', index=False)
+        except ImportError:
+            # No Parquet engine (pyarrow) installed - fall back to CSV
+            data_file = None
+    if data_file is None:
+        data_file = output_path / f"{dataset_name}_workload_over_time.csv"
+        workload_df.to_csv(data_file, index=False)
+    print(f"📄 Workload data saved: {data_file}")
     
     return workload_df
 
 
-def create_utilization_summary_plot(workload_df, dataset_name, output_path):
+def create_utilization_summary_plot(workload_df, dataset_name, output_path, cluster_frames=None):
     """Create separate plots for each resource type showing utilization over time."""
     
-    clusters = sorted(workload_df['cluster_name'].unique())
-    n_clusters = len(clusters)
+    if cluster_frames is None:
+        cluster_frames = group_by_cluster(workload_df)
+    n_clusters = len(cluster_frames)
     
     # Create separate plots for each resource type
     resource_types = [
@@ -270,43 +420,38 @@ def create_utilization_summary_plot(workload_df, dataset_name, output_path):
         ('vf', 'Virtual Functions Utilization', 'VF Usage %', 'count')
     ]
     
+    # One figure, cleared and reused for each resource type
+    fig = plt.figure(figsize=(14, 3*n_clusters))
+    
     for resource_type, title_suffix, ylabel, unit in resource_types:
-        fig, axes = plt.subplots(n_clusters, 1, figsize=(14, 3*n_clusters))
-        if n_clusters == 1:
-            axes = [axes]
+        fig.clf()
+        axes = fig.subplots(n_clusters, 1, squeeze=False)[:, 0]
         
         fig.suptitle(f'{title_suffix} Over Time - {dataset_name}', 
                      fontsize=14, fontweight='bold')
         
-        for i, cluster in enumerate(clusters):
-            cluster_data = workload_df[workload_df['cluster_name'] == cluster].copy()
+        for i, (cluster, cluster_data) in enumerate(cluster_frames.items()):
             ax = axes[i]
-            
-            cluster_data = cluster_data.sort_values('timeslice')
-            
-            if len(cluster_data) == 0:
-                continue
-                
             timeslices = cluster_data['timeslice'].values
             
             # Get the specific resource data
             if resource_type == 'cpu':
-                utilization = cluster_data['cpu_utilization']
-                requirement = cluster_data['cpu_req']
+                utilization = cluster_data['cpu_utilization'].to_numpy()
+                requirement = cluster_data['cpu_req'].to_numpy()
                 capacity = cluster_data['cpu_cap'].iloc[0] if len(cluster_data) > 0 else 0
                 color_req = 'blue'
                 color_cap = 'red'
                 abs_unit = 'Cores'
             elif resource_type == 'mem':
-                utilization = cluster_data['mem_utilization']
-                requirement = cluster_data['mem_req']
+                utilization = cluster_data['mem_utilization'].to_numpy()
+                requirement = cluster_data['mem_req'].to_numpy()
                 capacity = cluster_data['mem_cap'].iloc[0] if len(cluster_data) > 0 else 0
                 color_req = 'green'
                 color_cap = 'red'
                 abs_unit = 'Mi'
             else:  # vf
-                utilization = cluster_data.get('vf_utilization', cluster_data['vf_req'] / max(1, cluster_data['vf_cap'].iloc[0]) * 100 if len(cluster_data) > 0 else 0)
-                requirement = cluster_data['vf_req']
+                utilization = np.asarray(cluster_data.get('vf_utilization', cluster_data['vf_req'] / max(1, cluster_data['vf_cap'].iloc[0]) * 100 if len(cluster_data) > 0 else 0))
+                requirement = cluster_data['vf_req'].to_numpy()
                 capacity = cluster_data['vf_cap'].iloc[0] if len(cluster_data) > 0 else 0
                 color_req = 'purple'
                 color_cap = 'red'
@@ -316,8 +461,8 @@ def create_utilization_summary_plot(workload_df, dataset_name, output_path):
             ax2 = ax.twinx()
             
             # Plot absolute values on left axis (ax)
-            ax.plot(timeslices, requirement, 
-                   color=color_req, linewidth=2, label=f'Used ({abs_unit})', alpha=0.8)
+            plot_series(ax, timeslices, requirement,
+                        color=color_req, linewidth=2, label=f'Used ({abs_unit})', alpha=0.8)
             
             if capacity > 0:
                 ax.axhline(y=capacity, color=color_cap, linestyle='--', linewidth=2,
@@ -334,29 +479,22 @@ def create_utilization_summary_plot(workload_df, dataset_name, output_path):
             
             # Highlight high load periods with shaded regions
             if high_load_mask.any():
-                high_load_regions = []
-                start = None
-                for j, is_high in enumerate(high_load_mask):
-                    if is_high and start is None:
-                        start = timeslices[j]
-                    elif not is_high and start is not None:
-                        ax.axvspan(start, timeslices[j-1], alpha=0.15, color='orange', 
-                                  label='High Load Period' if not high_load_regions and i == 0 else "")
-                        high_load_regions.append((start, timeslices[j-1]))
-                        start = None
-                # Handle case where high load continues to the end
-                if start is not None:
-                    ax.axvspan(start, timeslices[-1], alpha=0.15, color='orange',
-                              label='High Load Period' if not high_load_regions and i == 0 else "")
+                # +1/-1 edges of the padded mask mark where each high-load run starts and ends
+                edges = np.diff(np.concatenate(([0], high_load_mask.astype(np.int8), [0])))
+                run_starts = np.flatnonzero(edges == 1)
+                run_ends = np.flatnonzero(edges == -1) - 1
+                for k, (start, end) in enumerate(zip(run_starts, run_ends)):
+                    ax.axvspan(timeslices[start], timeslices[end], alpha=0.15, color='orange',
+                              label='High Load Period' if k == 0 and i == 0 else "", rasterized=True)
             
             # Mark critical utilization points (>90%) - small dots only
             critical_mask = utilization > 90
             if critical_mask.any():
                 critical_timeslices = timeslices[critical_mask]
-                critical_values = requirement.values[critical_mask]
+                critical_values = requirement[critical_mask]
                 ax.scatter(critical_timeslices, critical_values, color='red', marker='o', 
                           s=20, label='Critical Load (>90%)' if critical_mask.sum() > 0 and i == 0 else "", 
-                          alpha=0.7, zorder=10)
+                          alpha=0.7, zorder=10, rasterized=True)
             
             # Configure left axis (absolute values) - normalized to 100% capacity
             ax.set_title(f'{cluster} - {title_suffix}', fontweight='bold')
@@ -384,14 +522,15 @@ def create_utilization_summary_plot(workload_df, dataset_name, output_path):
             if i == 0:
                 ax.legend(fontsize=8, loc='upper left')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save each resource type plot separately
         filename = f"{dataset_name}_{resource_type}_utilization_over_time.png"
         util_file = output_path / filename
-        plt.savefig(util_file, dpi=300, bbox_inches='tight')
+        fig.savefig(util_file, dpi=300, bbox_inches='tight')
         print(f"📊 {title_suffix} plot saved: {util_file}")
-        plt.close()  # Close the figure to free memory
+    
+    plt.close(fig)  # Close the figure to free memory
 
 
 def print_time_summary(workload_df, dataset_name):
@@ -408,32 +547,48 @@ def print_time_summary(workload_df, dataset_name):
     print(f"   Total timeslices: {total_timeslices}")
     print(f"   Duration: {duration_minutes:.1f} minutes ({duration_minutes/60:.1f} hours)")
     
+    # Per-row flags, then every per-cluster statistic in one groupby pass
+    cpu_utilization = workload_df['cpu_utilization']
+    mem_utilization = workload_df['mem_utilization']
+    flags = workload_df.assign(
+        high_load=(cpu_utilization + mem_utilization) / 2 > 70,
+        cpu_oversubscribed=cpu_utilization > 100,
+        mem_oversubscribed=mem_utilization > 100
+    )
+    stats = flags.groupby('cluster_name', sort=False).agg(
+        peak_cpu_idx=('cpu_utilization', 'idxmax'),
+        peak_mem_idx=('mem_utilization', 'idxmax'),
+        peak_jobs=('job_count', 'max'),
+        high_load_periods=('high_load', 'sum'),
+        total_periods=('timeslice', 'size'),
+        oversubscribed_cpu=('cpu_oversubscribed', 'sum'),
+        oversubscribed_mem=('mem_oversubscribed', 'sum')
+    )
+    
     print(f"\n📊 PEAK UTILIZATION BY CLUSTER:")
-    for cluster in workload_df['cluster_name'].unique():
-        cluster_data = workload_df[workload_df['cluster_name'] == cluster]
-        
-        peak_cpu = cluster_data['cpu_utilization'].max()
-        peak_mem = cluster_data['mem_utilization'].max()
-        peak_jobs = cluster_data['job_count'].max()
-        
-        peak_cpu_time = cluster_data[cluster_data['cpu_utilization'] == peak_cpu]['time_minutes'].iloc[0]
-        peak_mem_time = cluster_data[cluster_data['mem_utilization'] == peak_mem]['time_minutes'].iloc[0]
-        
-        # Calculate average utilization and high load periods
-        avg_utilization = (cluster_data['cpu_utilization'] + cluster_data['mem_utilization']) / 2
-        high_load_periods = len(cluster_data[avg_utilization > 70])
-        total_periods = len(cluster_data)
+    for cluster_stats in stats.itertuples():
+        cluster = cluster_stats.Index
+        total_periods = cluster_stats.total_periods
+        
+        # First row at each peak
+        peak_cpu = workload_df.at[cluster_stats.peak_cpu_idx, 'cpu_utilization']
+        peak_mem = workload_df.at[cluster_stats.peak_mem_idx, 'mem_utilization']
+        peak_cpu_time = workload_df.at[cluster_stats.peak_cpu_idx, 'time_minutes']
+        peak_mem_time = workload_df.at[cluster_stats.peak_mem_idx, 'time_minutes']
+        
+        # High load periods
+        high_load_periods = cluster_stats.high_load_periods
         high_load_percentage = (high_load_periods / total_periods * 100) if total_periods > 0 else 0
         
         print(f"   {cluster}:")
         print(f"      Peak CPU: {peak_cpu:.1f}% (at {peak_cpu_time:.1f}min)")
         print(f"      Peak Memory: {peak_mem:.1f}% (at {peak_mem_time:.1f}min)")
-        print(f"      Max concurrent jobs: {peak_jobs}")
+        print(f"      Max concurrent jobs: {cluster_stats.peak_jobs}")
         print(f"      High load periods (>70%): {high_load_periods}/{total_periods} ({high_load_percentage:.1f}%)")
         
         # Check for oversubscription periods
-        oversubscribed_cpu = len(cluster_data[cluster_data['cpu_utilization'] > 100])
-        oversubscribed_mem = len(cluster_data[cluster_data['mem_utilization'] > 100])
+        oversubscribed_cpu = cluster_stats.oversubscribed_cpu
+        oversubscribed_mem = cluster_stats.oversubscribed_mem
         
         if oversubscribed_cpu > 0:
             print(f"      ⚠️  CPU oversubscribed for {oversubscribed_cpu} timeslices ({oversubscribed_cpu/total_periods*100:.1f}%)")
@@ -442,12 +597,10 @@ def print_time_summary(workload_df, dataset_name):
     
     print(f"\n🚨 OVERALL ANALYSIS:")
     total_data_points = len(workload_df)
-    total_oversubscribed = len(workload_df[(workload_df['cpu_utilization'] > 100) | (workload_df['mem_utilization'] > 100)])
+    total_oversubscribed = int((flags['cpu_oversubscribed'] | flags['mem_oversubscribed']).sum())
     
-    # Calculate high load periods across all clusters
-    workload_df_temp = workload_df.copy()
-    workload_df_temp['avg_utilization'] = (workload_df_temp['cpu_utilization'] + workload_df_temp['mem_utilization']) / 2
-    total_high_load = len(workload_df_temp[workload_df_temp['avg_utilization'] > 70])
+    # High load periods across all clusters
+    total_high_load = int(flags['high_load'].sum())
     
     if total_oversubscribed > 0:
         print(f"   Oversubscribed periods: {total_oversubscribed}/{total_data_points} ({total_oversubscribed/total_data_points*100:.1f}%)")
@@ -469,6 +622,8 @@ def main():
     parser.add_argument("dataset", help="Dataset directory path")
     parser.add_argument("--output", "-o", help="Output directory (default: same as dataset)")
     parser.add_argument("--timeslice-duration", "-t", type=int, default=15, help="Duration of each timeslice in seconds (default: 15)")
+    parser.add_argument("--format", choices=['csv', 'parquet'], default='parquet',
+                        help="Workload data file format (default: parquet, CSV if pyarrow is missing)")
     
     args = parser.parse_args()
     
@@ -492,7 +647,8 @@ def main():
         print(f"✅ Calculated workload for {len(workload_df)} data points")
         
         # Create visualizations
-        create_time_based_visualizations(workload_df, dataset_name, output_dir, args.timeslice_duration)
+        create_time_based_visualizations(workload_df, dataset_name, output_dir, args.timeslice_duration,
+                                         args.format)
         
         # Print summary
         print_time_summary(workload_df, dataset_name)
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Workload Over Time Data
+
+Reads the per-timeslice workload table that visualize_workload_over_time.py
+saves next to its charts, for the tools that plot from it.
+"""
+
+import pandas as pd
+from pathlib import Path
+from typing import List, Optional
+
+
+def read_workload_over_time(directory: Path, dataset_name: str,
+                            columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """Load {dataset_name}_workload_over_time from `directory`, or None if it is missing.
+
+    visualize_workload_over_time.py writes Parquet by default and CSV with
+    --format csv or without pyarrow, so a dataset can hold both; the newer
+    file wins. The Parquet file is skipped if no Parquet engine is installed.
+    """
+    directory = Path(directory)
+    workload_files = [f for f in (directory / f"{dataset_name}_workload_over_time.parquet",
+                                  directory / f"{dataset_name}_workload_over_time.csv") if f.exists()]
+    for workload_file in sorted(workload_files, key=lambda f: f.stat().st_mtime, reverse=True):
+        try:
+            if workload_file.suffix == '.parquet':
+                return pd.read_parquet(workload_file, columns=columns)
+            return pd.read_csv(workload_file, usecols=columns)
+        except ImportError:
+            # No Parquet engine (pyarrow) installed - try the CSV
+            continue
+    return None
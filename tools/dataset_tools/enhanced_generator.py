@@ -5,13 +5,17 @@ Enhanced Dataset Generator for M-DRA with temporal load visualization.
 
 import os
 import random
-import csv
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 import argparse
 import pandas as pd
 import numpy as np
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
 
 @dataclass
 class DatasetConfig:
@@ -42,6 +46,7 @@ class EnhancedDatasetGenerator:
     def __init__(self, config: DatasetConfig):
         self.config = config
         random.seed(config.seed)
+        self.rng = np.random.default_rng(config.seed)
         
         # Define node instance families
         self.node_families = {
@@ -198,6 +203,15 @@ class EnhancedDatasetGenerator:
         mano_clusters = [c['id'] for c in clusters if c['mano_supported']]
         sriov_clusters = [c['id'] for c in clusters if c['sriov_supported']]
         all_cluster_ids = [c['id'] for c in clusters]
+        cluster_by_id = {c['id']: c for c in clusters}
+        
+        # Eligible clusters keyed by (mano_req, needs_vf)
+        eligible_by_req = {
+            (1, True): [c['id'] for c in clusters if c['mano_supported'] and c['sriov_supported']],
+            (1, False): mano_clusters,
+            (0, True): sriov_clusters,
+            (0, False): all_cluster_ids
+        }
         
         # Track job distribution
         cluster_job_counts = {cid: 0 for cid in all_cluster_ids}
@@ -215,55 +229,56 @@ class EnhancedDatasetGenerator:
         
         print(f"  Peak periods for temporal overlap: {peak_periods}")
         
-        for job_id in range(self.config.jobs):
-            # Determine requirements
-            mano_req = 1 if random.random() < 0.3 else 0
-            needs_vf = random.random() < 0.2
-            
-            # Filter eligible clusters
-            if mano_req and needs_vf:
-                eligible = [c for c in clusters if c['mano_supported'] and c['sriov_supported']]
-            elif mano_req:
-                eligible = [c for c in clusters if c['mano_supported']]
-            elif needs_vf:
-                eligible = [c for c in clusters if c['sriov_supported']]
-            else:
-                eligible = clusters
-            
-            if not eligible:
-                eligible = clusters
+        # Draw every job's random decisions up front in bulk; the loop below
+        # only does the load-balanced cluster choice and assembles the dicts
+        rng = self.rng
+        num_jobs = self.config.jobs
+        num_slices = self.config.timeslices
+        
+        # Requirements
+        mano_reqs = (rng.random(num_jobs) < 0.3).astype(int)
+        needs_vfs = rng.random(num_jobs) < 0.2
+        tie_breaks = rng.random(num_jobs)
+        vf_draws = rng.random(num_jobs)
+        
+        # Job timing - 70% during peak periods for temporal overlap
+        in_peak = (rng.random(num_jobs) < 0.7) & bool(peak_periods)
+        peak_jobs = np.flatnonzero(in_peak)
+        other_jobs = np.flatnonzero(~in_peak)
+        start_times = np.empty(num_jobs, dtype=int)
+        durations = np.empty(num_jobs, dtype=int)
+        if len(peak_jobs):
+            bounds = np.array(peak_periods)[rng.integers(len(peak_periods), size=len(peak_jobs))]
+            start_times[peak_jobs] = rng.integers(np.maximum(1, bounds[:, 0]),
+                                                  np.minimum(bounds[:, 1] - 2, num_slices - 4) + 1)
+            durations[peak_jobs] = rng.integers(3, np.minimum(7, num_slices - start_times[peak_jobs]) + 1)
+        start_times[other_jobs] = rng.integers(1, max(1, num_slices - 3) + 1, size=len(other_jobs))
+        durations[other_jobs] = rng.integers(2, np.minimum(5, num_slices - start_times[other_jobs]) + 1)
+        
+        # Job sizing - smaller jobs for better distribution
+        size_choices = rng.random(num_jobs)
+        size_low = np.select([size_choices < 0.6, size_choices < 0.85], [0.04, 0.12], 0.20)
+        size_high = np.select([size_choices < 0.6, size_choices < 0.85], [0.12, 0.20], 0.30)
+        cpu_factors = rng.uniform(size_low, size_high)
+        mem_factors = rng.uniform(size_low, size_high)
+        
+        for job_id, mano_req, needs_vf, tie_break, vf_draw, start_time, duration, cpu_factor, mem_factor in zip(
+                range(num_jobs), mano_reqs.tolist(), needs_vfs.tolist(), tie_breaks.tolist(), vf_draws.tolist(),
+                start_times.tolist(), durations.tolist(), cpu_factors.tolist(), mem_factors.tolist()):
+            # Eligible clusters
+            eligible_ids = eligible_by_req[mano_req, needs_vf]
+            if not eligible_ids:
+                eligible_ids = all_cluster_ids
                 needs_vf = False
             
             # Select cluster with load balancing (distribute jobs evenly)
-            eligible_ids = [c['id'] for c in eligible]
             min_jobs = min(cluster_job_counts[cid] for cid in eligible_ids)
             least_loaded = [cid for cid in eligible_ids if cluster_job_counts[cid] == min_jobs]
-            cluster_id = random.choice(least_loaded)
+            cluster_id = least_loaded[int(tie_break * len(least_loaded))]
             
-            cluster = next(c for c in clusters if c['id'] == cluster_id)
+            cluster = cluster_by_id[cluster_id]
             cluster_cap = cluster_caps[cluster_id]
             
-            # Job timing - 70% during peak periods for temporal overlap
-            if random.random() < 0.7 and peak_periods:
-                peak_start, peak_end = random.choice(peak_periods)
-                start_time = random.randint(max(1, peak_start), min(peak_end - 2, self.config.timeslices - 4))
-                duration = random.randint(3, min(7, self.config.timeslices - start_time))
-            else:
-                start_time = random.randint(1, max(1, self.config.timeslices - 3))
-                duration = random.randint(2, min(5, self.config.timeslices - start_time))
-            
-            # Job sizing - smaller jobs for better distribution
-            size_choice = random.random()
-            if size_choice < 0.6:
-                cpu_factor = random.uniform(0.04, 0.12)
-                mem_factor = random.uniform(0.04, 0.12)
-            elif size_choice < 0.85:
-                cpu_factor = random.uniform(0.12, 0.20)
-                mem_factor = random.uniform(0.12, 0.20)
-            else:
-                cpu_factor = random.uniform(0.20, 0.30)
-                mem_factor = random.uniform(0.20, 0.30)
-            
             # Calculate requirements
             cpu_req = max(1, int(cluster_cap['cpu'] * cpu_factor))
             mem_req = max(1, int(cluster_cap['mem'] * mem_factor))
@@ -271,7 +286,7 @@ class EnhancedDatasetGenerator:
             # VF requirements
             if needs_vf and cluster['sriov_supported'] and cluster_cap['vf'] > 0:
                 max_vf = min(6, cluster_cap['vf'] // 5)
-                vf_req = random.randint(1, max_vf) if max_vf > 0 else 0
+                vf_req = 1 + int(vf_draw * max_vf) if max_vf > 0 else 0
             else:
                 vf_req = 0
             
@@ -307,31 +322,24 @@ class EnhancedDatasetGenerator:
     
     def _calculate_cluster_capacities(self, clusters: List[Dict], nodes: List[Dict], jobs: List[Dict]) -> List[Dict]:
         """Calculate cluster capacities and current requirements."""
+        cluster_ids = [c['id'] for c in clusters]
+        
+        # One group-by pass over nodes and jobs; clusters without any get zeros
+        node_totals = (pd.DataFrame(nodes).groupby('default_cluster')[['cpu_cap', 'mem_cap', 'vf_cap']]
+                       .sum().reindex(cluster_ids, fill_value=0))
+        job_totals = (pd.DataFrame(jobs).groupby('default_cluster')[['cpu_req', 'mem_req', 'vf_req']]
+                      .sum().reindex(cluster_ids, fill_value=0))
+        totals = node_totals.join(job_totals).to_dict('index')
+        
         cluster_caps = []
         
         for cluster in clusters:
-            cluster_nodes = [n for n in nodes if n['default_cluster'] == cluster['id']]
-            cluster_jobs = [j for j in jobs if j['default_cluster'] == cluster['id']]
-            
-            cpu_cap = sum(n['cpu_cap'] for n in cluster_nodes)
-            mem_cap = sum(n['mem_cap'] for n in cluster_nodes)
-            vf_cap = sum(n['vf_cap'] for n in cluster_nodes)
-            
-            cpu_req = sum(j['cpu_req'] for j in cluster_jobs)
-            mem_req = sum(j['mem_req'] for j in cluster_jobs)
-            vf_req = sum(j['vf_req'] for j in cluster_jobs)
-            
             cluster_caps.append({
                 'id': cluster['id'],
                 'name': cluster['name'],
                 'mano_supported': cluster['mano_supported'],
                 'sriov_supported': cluster['sriov_supported'],
-                'cpu_cap': cpu_cap,
-                'mem_cap': mem_cap,
-                'vf_cap': vf_cap,
-                'cpu_req': cpu_req,
-                'mem_req': mem_req,
-                'vf_req': vf_req
+                **totals[cluster['id']]
             })
         
         return cluster_caps
@@ -339,70 +347,71 @@ class EnhancedDatasetGenerator:
     def _calculate_temporal_loads(self, clusters: List[Dict], jobs: List[Dict]) -> pd.DataFrame:
         """Calculate resource loads for each cluster at each timeslice."""
         cluster_ids = [c['id'] for c in clusters]
-        timeslices = list(range(self.config.timeslices))
-        
-        temporal_data = []
-        
-        for cluster_id in cluster_ids:
-            for timeslice in timeslices:
-                # Find jobs running in this cluster at this timeslice
-                running_jobs = [
-                    j for j in jobs 
-                    if (j['default_cluster'] == cluster_id and 
-                        j['start_time'] <= timeslice < j['start_time'] + j['duration'])
-                ]
-                
-                cpu_load = sum(j['cpu_req'] for j in running_jobs)
-                mem_load = sum(j['mem_req'] for j in running_jobs)
-                vf_load = sum(j['vf_req'] for j in running_jobs)
-                
-                temporal_data.append({
-                    'cluster_id': cluster_id,
-                    'timeslice': timeslice,
-                    'cpu_load': cpu_load,
-                    'mem_load': mem_load,
-                    'vf_load': vf_load,
-                    'job_count': len(running_jobs)
-                })
-        
-        return pd.DataFrame(temporal_data)
+        timeslices = np.arange(self.config.timeslices)
+        
+        num_slices = len(timeslices)
+        
+        starts = np.array([j['start_time'] for j in jobs], dtype=np.int64)
+        ends = starts + np.array([j['duration'] for j in jobs], dtype=np.int64)
+        cids = np.array([j['default_cluster'] for j in jobs], dtype=np.int64)
+        reqs = np.array([[j['cpu_req'], j['mem_req'], j['vf_req']] for j in jobs], dtype=np.int64)
+        
+        # cpu, mem, vf load and job count per (cluster, timeslice); int64 so
+        # summed mem requirements cannot wrap
+        loads = np.zeros((len(cluster_ids), num_slices, 4), dtype=np.int64)
+        
+        # Each job adds its cpu/mem/vf and a count at its start timeslice and
+        # removes them at its end; a cumulative sum over timeslices then gives
+        # the running totals without a (timeslice x job) mask in memory
+        position = {cluster_id: i for i, cluster_id in enumerate(cluster_ids)}
+        known = np.isin(cids, cluster_ids)
+        positions = np.array([position[cid] for cid in cids[known].tolist()], dtype=np.int64)
+        deltas = np.concatenate([reqs[known], np.ones((known.sum(), 1), dtype=np.int64)], axis=1)
+        changes = np.zeros((len(cluster_ids), num_slices + 1, 4), dtype=np.int64)
+        np.add.at(changes, (positions, np.clip(starts[known], 0, num_slices)), deltas)
+        np.subtract.at(changes, (positions, np.clip(ends[known], 0, num_slices)), deltas)
+        np.cumsum(changes[:, :num_slices], axis=1, out=loads)
+        
+        cpu_load, mem_load, vf_load, job_count = loads.reshape(-1, 4).T
+        
+        return pd.DataFrame({
+            'cluster_id': np.repeat(cluster_ids, num_slices),
+            'timeslice': np.tile(timeslices, len(cluster_ids)),
+            'cpu_load': cpu_load,
+            'mem_load': mem_load,
+            'vf_load': vf_load,
+            'job_count': job_count
+        })
     
     def _write_clusters(self, clusters: List[Dict], output_dir: str):
         """Write clusters.csv file."""
         filepath = os.path.join(output_dir, 'clusters.csv')
-        with open(filepath, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['id', 'name', 'mano_supported', 'sriov_supported'])
-            writer.writeheader()
-            writer.writerows(clusters)
+        pd.DataFrame(clusters, columns=['id', 'name', 'mano_supported', 'sriov_supported']).to_csv(filepath, index=False)
     
     def _write_nodes(self, nodes: List[Dict], output_dir: str):
         """Write nodes.csv file."""
         filepath = os.path.join(output_dir, 'nodes.csv')
-        with open(filepath, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['id', 'default_cluster', 'cpu_cap', 'mem_cap', 'vf_cap', 'relocation_cost'])
-            writer.writeheader()
-            writer.writerows(nodes)
+        pd.DataFrame(nodes, columns=['id', 'default_cluster', 'cpu_cap', 'mem_cap', 'vf_cap', 'relocation_cost']).to_csv(filepath, index=False)
     
     def _write_jobs(self, jobs: List[Dict], output_dir: str):
         """Write jobs.csv file."""
         filepath = os.path.join(output_dir, 'jobs.csv')
-        with open(filepath, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['id', 'default_cluster', 'cpu_req', 'mem_req', 'vf_req', 'mano_req', 'start_time', 'duration', 'relocation_cost'])
-            writer.writeheader()
-            writer.writerows(jobs)
+        pd.DataFrame(jobs, columns=['id', 'default_cluster', 'cpu_req', 'mem_req', 'vf_req', 'mano_req', 'start_time', 'duration', 'relocation_cost']).to_csv(filepath, index=False)
     
     def _write_clusters_cap(self, clusters_cap: List[Dict], output_dir: str):
         """Write clusters_cap.csv file."""
         filepath = os.path.join(output_dir, 'clusters_cap.csv')
-        with open(filepath, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['id', 'name', 'mano_supported', 'sriov_supported', 'cpu_cap', 'mem_cap', 'vf_cap', 'cpu_req', 'mem_req', 'vf_req'])
-            writer.writeheader()
-            writer.writerows(clusters_cap)
+        pd.DataFrame(clusters_cap, columns=['id', 'name', 'mano_supported', 'sriov_supported', 'cpu_cap', 'mem_cap', 'vf_cap', 'cpu_req', 'mem_req', 'vf_req']).to_csv(filepath, index=False)
     
     def _write_temporal_loads(self, temporal_loads: pd.DataFrame, output_dir: str):
         """Write temporal loads CSV for visualization."""
         filepath = os.path.join(output_dir, 'temporal_loads.csv')
-        temporal_loads.to_csv(filepath, index=False)
+        if pa is not None:
+            # Arrow's multi-threaded writer; all columns are numeric, so no quoting is needed
+            pa_csv.write_csv(pa.Table.from_pandas(temporal_loads, preserve_index=False), filepath,
+                             write_options=pa_csv.WriteOptions(quoting_style='none'))
+        else:
+            temporal_loads.to_csv(filepath, index=False)
         print(f"  ✓ Temporal loads data saved: temporal_loads.csv")
     
     def _plot_cluster_diagram(self, clusters_cap: List[Dict], output_dir: str):
@@ -467,60 +476,56 @@ class EnhancedDatasetGenerator:
     def _plot_temporal_loads(self, temporal_loads: pd.DataFrame, output_dir: str):
         """Generate temporal load visualization."""
         try:
+            import matplotlib
+            matplotlib.use('Agg')  # Plot is only saved to disk - no GUI backend needed
             import matplotlib.pyplot as plt
-            import numpy as np
         except ImportError:
             print("  Note: matplotlib not available, skipping temporal plots")
             return
         
-        cluster_ids = sorted(temporal_loads['cluster_id'].unique())
+        cluster_groups = temporal_loads.groupby('cluster_id')
         resources = [('cpu_load', 'CPU'), ('mem_load', 'Memory'), ('vf_load', 'VF')]
         
-        fig, axes = plt.subplots(len(cluster_ids), len(resources), figsize=(15, 4 * len(cluster_ids)))
-        if len(cluster_ids) == 1:
+        fig, axes = plt.subplots(cluster_groups.ngroups, len(resources), figsize=(15, 4 * cluster_groups.ngroups))
+        if cluster_groups.ngroups == 1:
             axes = axes.reshape(1, -1)
         
-        for i, cluster_id in enumerate(cluster_ids):
-            cluster_data = temporal_loads[temporal_loads['cluster_id'] == cluster_id]
+        for i, (cluster_id, cluster_data) in enumerate(cluster_groups):
+            timeslices = cluster_data['timeslice'].to_numpy()
             
             for j, (resource, label) in enumerate(resources):
                 ax = axes[i, j]
                 
-                timeslices = cluster_data['timeslice']
-                loads = cluster_data[resource]
+                loads = cluster_data[resource].to_numpy()
+                peak_idx = loads.argmax()
+                max_val = loads[peak_idx]
                 
                 # Plot load over time
                 ax.plot(timeslices, loads, 'b-', linewidth=2, marker='o', markersize=4)
                 
-                # Highlight high load periods (>80% of max)
-                if loads.max() > 0:
-                    high_threshold = loads.max() * 0.8
-                    high_load_mask = loads > high_threshold
+                if max_val > 0:
+                    # Highlight high load periods (>80% of max)
+                    high_load_mask = loads > max_val * 0.8
                     ax.scatter(timeslices[high_load_mask], loads[high_load_mask], 
                              color='red', s=50, zorder=5, label='High Load')
-                
-                # Add peak annotations
-                if loads.max() > 0:
-                    peak_idx = loads.idxmax()
-                    peak_time = cluster_data.loc[peak_idx, 'timeslice']
-                    peak_value = loads.max()
-                    ax.annotate(f'Peak: {peak_value}', xy=(peak_time, peak_value),
+                    
+                    # Add peak annotation
+                    ax.annotate(f'Peak: {max_val}', xy=(timeslices[peak_idx], max_val),
                               xytext=(5, 5), textcoords='offset points', fontsize=9,
                               bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.7))
+                    ax.legend()
                 
                 ax.set_title(f'Cluster {cluster_id} - {label} Load Over Time', fontweight='bold')
                 ax.set_xlabel('Timeslice')
                 ax.set_ylabel(f'{label} Load')
                 ax.grid(True, alpha=0.3)
-                
-                if any(high_load_mask) if loads.max() > 0 else False:
-                    ax.legend()
         
         plt.tight_layout()
         fig.suptitle('Temporal Resource Load Analysis', fontsize=16, fontweight='bold', y=0.98)
         
+        # One panel per cluster and resource - 150 dpi keeps tall grids quick to encode
         plot_path = os.path.join(output_dir, 'temporal_loads.png')
-        plt.savefig(plot_path, dpi=300, bbox_inches='tight')
+        plt.savefig(plot_path, dpi=150, bbox_inches='tight')
         plt.close()
         
         print(f"  ✓ Temporal loads plot saved: temporal_loads.png")
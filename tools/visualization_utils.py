@@ -7,6 +7,7 @@ dataset generation and reduction tools.
 """
 
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -55,43 +56,39 @@ def generate_dataset_visualizations(dataset_dir: Path, dataset_name: Optional[st
     except Exception as e:
         print(f"     ❌ Error generating workload over time: {str(e)[:100]}")
     
-    # 2. Dataset overview
-    try:
-        print(f"  📊 Creating comprehensive dataset overview...")
-        result = subprocess.run(
-            ['python3', 'tools/analysis_tools/create_dataset_overview.py', str(dataset_dir)],
-            capture_output=True,
-            text=True,
-            timeout=60,
-            cwd=Path.cwd()
-        )
-        
-        if result.returncode == 0:
-            print(f"     ✅ Dataset overview created")
-            visualizations_generated.append('dataset_overview')
-        else:
-            print(f"     ⚠️  Dataset overview failed: {result.stderr[:100]}")
-    except Exception as e:
-        print(f"     ❌ Error generating dataset overview: {str(e)[:100]}")
+    # 2 & 3. Dataset overview and slide summary only depend on the workload
+    # data (Parquet or CSV) written above, so render them concurrently. Each
+    # tool already runs in its own interpreter; the threads just wait on the
+    # two subprocesses.
+    figure_tools = [
+        ('dataset_overview', 'create_dataset_overview.py', 'comprehensive dataset overview', 'Dataset overview'),
+        ('slide_summary', 'create_slide_summary.py', 'slide summary', 'Slide summary'),
+    ]
     
-    # 3. Slide summary
-    try:
-        print(f"  📑 Creating slide summary...")
-        result = subprocess.run(
-            ['python3', 'tools/analysis_tools/create_slide_summary.py', str(dataset_dir)],
-            capture_output=True,
-            text=True,
-            timeout=60,
-            cwd=Path.cwd()
-        )
+    print(f"  📊 Creating comprehensive dataset overview and slide summary...")
+    with ThreadPoolExecutor(max_workers=len(figure_tools)) as executor:
+        futures = [
+            executor.submit(
+                subprocess.run,
+                ['python3', f'tools/analysis_tools/{script}', str(dataset_dir)],
+                capture_output=True,
+                text=True,
+                timeout=60,
+                cwd=Path.cwd()
+            )
+            for _, script, _, _ in figure_tools
+        ]
         
-        if result.returncode == 0:
-            print(f"     ✅ Slide summary created")
-            visualizations_generated.append('slide_summary')
-        else:
-            print(f"     ⚠️  Slide summary failed: {result.stderr[:100]}")
-    except Exception as e:
-        print(f"     ❌ Error generating slide summary: {str(e)[:100]}")
+        for (key, _, description, label), future in zip(figure_tools, futures):
+            try:
+                result = future.result()
+                if result.returncode == 0:
+                    print(f"     ✅ {label} created")
+                    visualizations_generated.append(key)
+                else:
+                    print(f"     ⚠️  {label} failed: {result.stderr[:100]}")
+            except Exception as e:
+                print(f"     ❌ Error generating {description}: {str(e)[:100]}")
     
     # Summary
     if len(visualizations_generated) > 0: